@@ -2,9 +2,15 @@
 
 import json
 import os
-import sys
+
+from PySide6.QtCore import Slot
 
 from src.controllers.base_controller import BaseAppController
+from src.services import read_json, write_json
+
+# Line printed by generate_report.py once the report has been written.
+_HTML_PREFIX = "HTML report generated at: "
+_HTML_PREFIX_LEN = len(_HTML_PREFIX)
 
 
 class AppController(BaseAppController):
@@ -12,6 +18,9 @@ class AppController(BaseAppController):
 
     def __init__(self, app_name):
         super().__init__(app_name)
+        # Filled by load_config and applied to each tab by restore_tab_state.
+        self._default_settings = {}
+        self._saved_state = {}
         self.register_task_handlers(
             finished={
                 "get_edb": self._handle_get_edb_finished,
@@ -20,8 +29,7 @@ class AppController(BaseAppController):
                 "run_sim": self._handle_run_sim_finished,
                 "run_cct": self._handle_run_cct_finished,
                 "modify_xml": self._handle_modify_xml_finished,
-                "get_loss": self._handle_get_loss_finished,
-                "generate_report": self._handle_generate_report_finished,
+                "post_processing": self._handle_post_processing_finished,
             },
             errored={
                 "get_edb": self._handle_get_edb_error,
@@ -29,8 +37,7 @@ class AppController(BaseAppController):
                 "set_sim": self._handle_set_sim_error,
                 "run_sim": self._handle_run_sim_error,
                 "run_cct": self._handle_run_cct_error,
-                "get_loss": self._handle_get_loss_error,
-                "generate_report": self._handle_generate_report_error,
+                "post_processing": self._handle_post_processing_error,
             },
         )
 
@@ -53,61 +60,62 @@ class AppController(BaseAppController):
 
         sweeps = settings.get("frequency_sweeps")
         if sweeps is not None:
-            simulation_tab.sweeps_table.setRowCount(0)
-            for sweep in sweeps:
-                simulation_tab.add_sweep(sweep)
+            simulation_tab.set_sweeps(sweeps)
 
     def load_config(self):
         """Load configuration but explicitly skip restoring the last project."""
         config_path = self.get_config_path()
-        simulation_tab = self.tabs.get("simulation_tab")
-        import_tab = self.tabs.get("import_tab")
 
         # Load app-level defaults from config.json
         defaults = {}
         if os.path.exists(config_path):
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    defaults = json.load(f)
+                with open(config_path, "rb") as f:
+                    defaults = json.loads(f.read())
             except (json.JSONDecodeError, OSError) as e:
                 self.log(f"Could not load default config: {e}", "orange")
 
         actions = defaults.get("actions") if isinstance(defaults, dict) else None
         self.actions_config = actions if isinstance(actions, dict) else {}
 
-        if simulation_tab and defaults.get("settings"):
-            self._apply_simulation_settings_to_tab(simulation_tab, defaults.get("settings", {}))
-
+        self._default_settings = defaults.get("settings") or {}
         # Load persisted user state
-        state = self.state_store.load(self.app_name)
-
-        if simulation_tab:
-            sim_state = state.get("simulation_settings")
-            if sim_state:
-                self._apply_simulation_settings_to_tab(simulation_tab, sim_state)
-
-        if import_tab:
-            edb_version = state.get("edb_version") or "2024.1"
-            import_tab.edb_version_input.setText(edb_version)
+        self._saved_state = self.state_store.load(self.app_name)
 
         # Explicitly do NOT load the last project file.
         self.project_file = None
 
-        # Clear any residual data in CCT-specific tabs.
-        cct_tab = self.tabs.get("cct_tab")
+        # Tabs built later are restored as they are created.
+        loaded_tabs = self.get_loaded_tabs()
+        for tab_name, tab in loaded_tabs.items():
+            self.restore_tab_state(tab_name, tab)
+
+        # Clear any residual data in CCT-specific tabs. Tabs that have not
+        # been built yet start out empty, so they are not created for this.
+        cct_tab = loaded_tabs.get("cct_tab")
         if cct_tab:
             cct_tab.project_path_input.setText("")
             cct_tab.touchstone_path_input.setText("")
             if hasattr(cct_tab, "_clear_port_table"):
                 cct_tab._clear_port_table()
 
-        table_tab = self.tabs.get("table")
+        table_tab = loaded_tabs.get("table")
         if table_tab:
             table_tab.csv_path_input.setText("")
             if hasattr(table_tab, "_clear_table"):
                 table_tab._clear_table()
             setattr(table_tab, "_current_project", None)
 
+    def restore_tab_state(self, tab_name, tab):
+        if tab_name == "simulation_tab":
+            if self._default_settings:
+                self._apply_simulation_settings_to_tab(tab, self._default_settings)
+            sim_state = self._saved_state.get("simulation_settings")
+            if sim_state:
+                self._apply_simulation_settings_to_tab(tab, sim_state)
+        elif tab_name == "import_tab":
+            tab.edb_version_input.setText(self._saved_state.get("edb_version") or "2024.1")
+
     def _refresh_cct_tabs(self, project_path=None):
         path = project_path or self.project_file
 
@@ -163,8 +171,7 @@ class AppController(BaseAppController):
 
         if import_tab and self.project_file and os.path.exists(self.project_file):
             try:
-                with open(self.project_file, "r") as f:
-                    project_data = json.load(f)
+                project_data = read_json(self.project_file)
                 imported_xml = project_data.get("xml_path", "")
                 import_tab.imported_stackup_path.setText(imported_xml)
                 self.log(f"Imported stackup path loaded: {imported_xml}")
@@ -209,16 +216,10 @@ class AppController(BaseAppController):
         self._reset_task_button(context)
         self.log("Stackup modification process finished.")
 
-    def _handle_get_loss_finished(self, task_id, exit_code, context):
-        self.log("Successfully got loss data. Generating HTML report...")
-        result_tab = self.tabs.get("result_tab")
-        if result_tab:
-            result_tab.run_generate_report()
-
-    def _handle_generate_report_finished(self, task_id, exit_code, context):
+    def _handle_post_processing_finished(self, task_id, exit_code, context):
         result_tab = self.tabs.get("result_tab")
         self._reset_task_button(context)
-        self.log("HTML report generation finished.")
+        self.log("Loss data collected and HTML report generation finished.")
         if result_tab and self.report_path:
             result_tab.html_group.setVisible(True)
 
@@ -247,62 +248,46 @@ class AppController(BaseAppController):
         self.log("CCT calculation finished.")
         self.log(f"CCT calculation failed with exit code {exit_code}. {log_message}", "red")
 
-    def _handle_get_loss_error(self, task_id, exit_code, log_message, context):
-        result_tab = self.tabs.get("result_tab")
-        self._reset_task_button(context)
-        if result_tab:
-            result_tab.html_group.setVisible(False)
-        self.log(f"Get loss process failed with exit code {exit_code}. {log_message}", "red")
-
-    def _handle_generate_report_error(self, task_id, exit_code, log_message, context):
+    def _handle_post_processing_error(self, task_id, exit_code, log_message, context):
         result_tab = self.tabs.get("result_tab")
         self._reset_task_button(context)
         if result_tab:
             result_tab.html_group.setVisible(False)
-        self.log(f"HTML report generation failed with exit code {exit_code}. {log_message}", "red")
+        self.log(f"Post-processing failed with exit code {exit_code}. {log_message}", "red")
 
     def _queue_simulation_run(self, context):
         simulation_tab = self.tabs.get("simulation_tab")
         if not simulation_tab or not self.project_file:
             self.log("Unable to start simulation run: missing project file.", "red")
-            self._restore_button(context.get("button"), context.get("button_style"), context.get("button_reset_text", "Apply"))
+            self._reset_task_button(context)
             return
 
-        action_spec = self.get_action_spec("run_sim", tab_name="simulation_tab")
-        script_path = action_spec["script"]
-        command = [sys.executable, script_path, self.project_file]
-        if action_spec.get("args"):
-            command.extend(action_spec["args"])
-
-        run_metadata = {
-            "type": "run_sim",
-            "description": "Running SIwave simulation",
-            "button": context.get("button") or simulation_tab.apply_simulation_button,
-            "button_style": context.get("button_style") or getattr(simulation_tab, "apply_simulation_button_original_style", ""),
-            "button_reset_text": context.get("button_reset_text", "Apply"),
-        }
-
-        self._submit_task(
-            command,
-            metadata=run_metadata,
+        self.run_script(
+            "run_sim",
+            self.project_file,
+            tab_name="simulation_tab",
+            description="Running SIwave simulation",
+            button=context.button or simulation_tab.apply_simulation_button,
+            button_style=context.button_style or getattr(simulation_tab, "apply_simulation_button_original_style", ""),
+            button_reset_text=context.button_reset_text,
             input_path=self.project_file,
-            description=run_metadata["description"],
-            working_dir=action_spec.get("working_dir"),
-            env=action_spec.get("env"),
         )
 
+    @Slot(str, str, str, object)
     def on_task_log_message(self, task_id, level, message, metadata):
         super().on_task_log_message(task_id, level, message, metadata)
 
-        if metadata.get("type") == "generate_report" and "HTML report generated at: " in message:
+        if message.startswith(_HTML_PREFIX) and metadata.type == "post_processing":
             result_tab = self.tabs.get("result_tab")
-            self.report_path = message.split("HTML report generated at: ")[1].strip()
+            self.report_path = message[_HTML_PREFIX_LEN:].strip()
             if result_tab:
                 result_tab.html_path_input.setText(self.report_path)
 
     def save_config(self):
-        simulation_tab = self.tabs.get("simulation_tab")
-        import_tab = self.tabs.get("import_tab")
+        # Only tabs that were built can hold changes; never build one to save it.
+        loaded_tabs = self.get_loaded_tabs()
+        simulation_tab = loaded_tabs.get("simulation_tab")
+        import_tab = loaded_tabs.get("import_tab")
         if not simulation_tab: return
 
         sweeps = []
@@ -334,11 +319,9 @@ class AppController(BaseAppController):
 
         if self.project_file and os.path.exists(self.project_file) and import_tab:
             try:
-                with open(self.project_file, "r", encoding="utf-8") as f:
-                    project_config = json.load(f)
+                project_config = read_json(self.project_file)
                 project_config["edb_version"] = import_tab.edb_version_input.text()
                 project_config["app_name"] = self.app_name
-                with open(self.project_file, "w", encoding="utf-8") as f:
-                    json.dump(project_config, f, indent=2)
+                write_json(self.project_file, project_config)
             except (IOError, json.JSONDecodeError) as e:
                 self.log(f"Could not update project config: {e}", "red")
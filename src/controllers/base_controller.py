@@ -3,17 +3,65 @@
 import json
 import os
 import sys
+from functools import lru_cache
+from types import MappingProxyType
 
-from PySide6.QtCore import QObject
-from PySide6.QtGui import QColor
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
 
 from src.controllers.tab_context import TabContext
-from src.services import AppStateStore, ExternalScriptRunner
+from src.controllers.task_context import TaskContext
+from src.services import AppStateStore, ExternalScriptRunner, LogFileWriter
+
+# Log colour for each task output level; other levels use the default.
+_LEVEL_COLORS = {"error": "red", "warning": "orange"}
+
+_NO_LISTENERS = ((), ())
+
+# Shared read-only payload for events published without one.
+_EMPTY_PAYLOAD = MappingProxyType({})
+
+# Style of a button whose task is running.
+_RUNNING_BUTTON_STYLE = "background-color: yellow; color: black;"
+
+# Upper bound on log lines waiting for the next flush. A runaway script can
+# print faster than the GUI drains; beyond this the middle of the batch is
+# replaced by a single "truncated" marker.
+_MAX_PENDING_LOG = 20000
+
+# Checkout locations, worked out once at import.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SCRIPTS_DIR = os.path.join(_PROJECT_ROOT, "src", "scripts")
+
+
+@lru_cache(maxsize=None)
+def _qcolor(name):
+    """Return a shared QColor so colour names are parsed only once."""
+    return QColor(name)
+
+
+@lru_cache(maxsize=None)
+def _char_format(color):
+    """Return the shared text format used for log lines in ``color``."""
+    text_format = QTextCharFormat()
+    text_format.setForeground(_qcolor(color or "black"))
+    return text_format
+
+
+@lru_cache(maxsize=1024)
+def _resolve_path(project_root, path):
+    """Return ``path`` made absolute against ``project_root`` and normalized."""
+    if os.path.isabs(path):
+        return os.path.normpath(path)
+    return os.path.normpath(os.path.join(project_root, path))
 
 
 class BaseAppController(QObject):
     """Base controller with shared functionality for all apps."""
 
+    # Emitted from the log writer thread; delivered on the GUI thread.
+    _log_write_failed = Signal(str)
+
     def __init__(self, app_name):
         super().__init__()
         self.app_name = app_name
@@ -23,15 +71,36 @@ class BaseAppController(QObject):
         self.pcb_data = None
         self.log_window = None  # This will be set by the GUI
         self.tabs = {}  # This will be populated with tab instances
+        self._action_spec_cache = {}
         self.actions_config = {}
 
         # Define project root and scripts directory robustly
-        self.project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.scripts_dir = os.path.join(self.project_root, "src", "scripts")
+        self.project_root = _PROJECT_ROOT
+        self._project_root_norm = os.path.normpath(_PROJECT_ROOT)
+        self.scripts_dir = _SCRIPTS_DIR
+        self.python_executable = sys.executable
 
         # Persistence and external process coordination
         self.state_store = AppStateStore()
-        self.script_runner = ExternalScriptRunner(parent=self)
+        # Changed global settings are written back shortly after the last
+        # change, so per-keystroke edits do not rewrite the file. Only the
+        # changed keys are kept here and merged into the file when saving,
+        # so another controller's newer values are never overwritten.
+        self._pending_global_settings = {}
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(500)
+        self._settings_save_timer.timeout.connect(self._save_global_settings)
+        self.script_runner = ExternalScriptRunner(
+            parent=self,
+            worker_script=os.path.join(self.scripts_dir, "aedt_worker.py"),
+        )
+        global_settings = self.get_global_settings()
+        self.script_runner.use_worker = global_settings.get("script_worker", True)
+        try:
+            self.script_runner.set_log_level(global_settings.get("log_level", "info"))
+        except ValueError:
+            pass  # keep the default; a bad setting must not stop the app
         self.script_runner.started.connect(self.on_task_started)
         self.script_runner.finished.connect(self.on_task_finished)
         self.script_runner.error.connect(self.on_task_error)
@@ -47,15 +116,34 @@ class BaseAppController(QObject):
         self._shared_state = {}
         self._tab_states = {}
         self._tab_contexts = {}
-        self._tab_event_permissions = self.configure_tab_events() or {}
-        self._controller_event_handlers = {}
-        self._tab_event_subscribers = {}
+        self._tab_event_permissions = {
+            tab_name: frozenset(events or ())
+            for tab_name, events in (self.configure_tab_events() or {}).items()
+        }
+        # event name -> (controller handlers, (tab name, callback) subscribers).
+        # Rebuilt on registration so dispatching is a single lookup.
+        self._dispatch_table = {}
+
+        # Log lines are buffered briefly and written to the GUI and the log
+        # file in batches so chatty scripts do not flood the event loop.
+        self._pending_log = []
+        self._pending_dropped = 0
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)  # ~20 Hz is plenty for a log view
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+        self._log_cursor = None
+        # The project log file is written off the GUI thread.
+        self._log_writer = LogFileWriter(on_error=self._log_write_failed.emit)
+        self._log_write_failed.connect(self._on_log_write_failed)
 
         # Built-in events exposed to tabs.
         self.register_event_handler("project_update", self._handle_project_update_event)
 
     def set_project_log_path(self, project_json_path):
         """Sets the path for the project-specific log file."""
+        # Lines queued for the previous log file must not end up in the new one.
+        self._flush_log_buffer()
         if project_json_path:
             log_dir = os.path.dirname(project_json_path)
             log_name = os.path.splitext(os.path.basename(project_json_path))[0] + ".log"
@@ -66,12 +154,36 @@ class BaseAppController(QObject):
             self.project_log_path = None
 
     def connect_signals(self, tabs):
-        """Connect signals for all tabs provided by the GUI."""
+        """Connect signals for all tabs provided by the GUI.
+
+        ``tabs`` may build its tabs lazily (see ``gui.LazyTabs``); only the
+        tabs that already exist are bound here, the others are passed to
+        :meth:`bind_tab` as they are created.
+        """
         self.tabs = tabs or {}
-        for tab in self.tabs.values():
-            binder = getattr(tab, "bind_to_controller", None)
-            if callable(binder):
-                binder()
+        for tab_name, tab in self.get_loaded_tabs().items():
+            self.bind_tab(tab, tab_name)
+
+    def bind_tab(self, tab, tab_name=None):
+        """Let ``tab`` connect its widgets to the controller and restore its saved settings."""
+        binder = getattr(tab, "bind_to_controller", None)
+        if callable(binder):
+            binder()
+        if tab_name:
+            self.restore_tab_state(tab_name, tab)
+
+    def restore_tab_state(self, tab_name, tab):
+        """Fill a newly created tab from the defaults and state read by ``load_config``.
+
+        Called for every tab as it is built, and again from ``load_config``
+        for the tabs that already exist, so ``load_config`` never has to
+        build a tab just to restore it.
+        """
+
+    def get_loaded_tabs(self):
+        """Return the tabs created so far without building deferred ones."""
+        loaded = getattr(self.tabs, "loaded", None)
+        return loaded() if callable(loaded) else self.tabs
 
     # ------------------------------------------------------------------ #
     # Tab context lifecycle
@@ -91,13 +203,13 @@ class BaseAppController(QObject):
         return self._tab_contexts.get(tab_name)
 
     def register_event_handler(self, event_name, handler):
-        handlers = self._controller_event_handlers.setdefault(event_name, [])
+        handlers, subscribers = self._dispatch_table.get(event_name, _NO_LISTENERS)
         if handler not in handlers:
-            handlers.append(handler)
+            self._dispatch_table[event_name] = (handlers + (handler,), subscribers)
 
     def register_tab_listener(self, tab_name, event_name, callback):
-        subscribers = self._tab_event_subscribers.setdefault(event_name, [])
-        subscribers.append((tab_name, callback))
+        handlers, subscribers = self._dispatch_table.get(event_name, _NO_LISTENERS)
+        self._dispatch_table[event_name] = (handlers, subscribers + ((tab_name, callback),))
 
     def dispatch_tab_event(self, source_tab, event_name, payload=None):
         allowed = self._tab_event_permissions.get(source_tab)
@@ -106,12 +218,13 @@ class BaseAppController(QObject):
                 f"Tab '{source_tab}' attempted to publish unauthorized event '{event_name}'"
             )
 
-        payload = payload or {}
+        payload = payload or _EMPTY_PAYLOAD
+        handlers, subscribers = self._dispatch_table.get(event_name, _NO_LISTENERS)
 
-        for handler in self._controller_event_handlers.get(event_name, []):
+        for handler in handlers:
             handler(source_tab, payload)
 
-        for target_tab, callback in self._tab_event_subscribers.get(event_name, []):
+        for target_tab, callback in subscribers:
             try:
                 callback(source_tab, payload)
             except Exception as exc:
@@ -162,27 +275,104 @@ class BaseAppController(QObject):
         return None
 
     def log_message(self, message, color=None):
-        """Log a message to the GUI's log window and the project log file."""
-        # Log to GUI
-        if self.log_window:
-            if color:
-                self.log_window.setTextColor(QColor(color))
-            self.log_window.append(message)
-            self.log_window.setTextColor(QColor("black"))
-            self.log_window.verticalScrollBar().setValue(self.log_window.verticalScrollBar().maximum())
+        """Queue a message for the GUI's log window and the project log file."""
+        self._pending_log.append((message, color))
+        if len(self._pending_log) > _MAX_PENDING_LOG:
+            self._truncate_pending_log()
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _truncate_pending_log(self):
+        """Drop the middle of an overlong batch, keeping its first and latest lines."""
+        pending = self._pending_log
+        head = tail = _MAX_PENDING_LOG // 4
+        # Once a batch has been truncated, pending[head] holds the marker.
+        start = head + 1 if self._pending_dropped else head
+        end = len(pending) - tail
+        self._pending_dropped += end - start
+        del pending[start:end]
+        marker = (f"... [truncated {self._pending_dropped} lines]", "orange")
+        if start == head:
+            pending.insert(head, marker)
+        else:
+            pending[head] = marker
+
+    def flush_log(self):
+        """Write any queued log messages immediately."""
+        self._flush_log_buffer()
+
+    def close_log(self):
+        """Flush queued log messages, wait for them to reach disk and close the log file."""
+        self._flush_log_buffer()
+        self._log_writer.close()
+
+    def shutdown(self):
+        """Save settings, release the log file and stop the script worker before the app goes away."""
+        if self._settings_save_timer.isActive():
+            self._save_global_settings()
+        self.close_log()
+        self.script_runner.shutdown()
+
+    def _flush_log_buffer(self):
+        """Write all queued log messages in one pass."""
+        self._log_flush_timer.stop()
+        pending = self._pending_log
+        if not pending:
+            return
+        self._pending_log = []
+        self._pending_dropped = 0
 
-        # Log to file
+        # Log to GUI, one append per run of consecutive same-colour lines
+        if self.log_window:
+            # Only follow new output if the user has not scrolled up to read.
+            scrollbar = self.log_window.verticalScrollBar()
+            at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+            cursor = self._log_end_cursor()
+            cursor.beginEditBlock()
+            run_color = pending[0][1]
+            run_lines = []
+            for message, color in pending:
+                if color != run_color:
+                    self._append_log_run(run_lines, run_color, cursor)
+                    run_color, run_lines = color, []
+                run_lines.append(message)
+            self._append_log_run(run_lines, run_color, cursor)
+            cursor.endEditBlock()
+            if at_bottom:
+                scrollbar.setValue(scrollbar.maximum())
+
+        # Log to file (on the writer thread)
         if self.project_log_path:
-            try:
-                with open(self.project_log_path, "a", encoding="utf-8") as f:
-                    f.write(message + "\n")
-            except IOError as e:
-                # If logging to file fails, log an error to the GUI
-                error_msg = f"CRITICAL: Could not write to log file {self.project_log_path}. Error: {e}"
-                if self.log_window:
-                    self.log_window.setTextColor(QColor("red"))
-                    self.log_window.append(error_msg)
-                    self.log_window.setTextColor(QColor("black"))
+            text = "\n".join(message for message, _ in pending) + "\n"
+            if not self._log_writer.write(self.project_log_path, text):
+                self._on_log_write_failed(
+                    f"WARNING: Log file {self.project_log_path} is falling behind; {len(pending)} lines were not written."
+                )
+
+    @Slot(str)
+    def _on_log_write_failed(self, message):
+        # If logging to file fails, log an error to the GUI
+        if self.log_window:
+            self._append_log_run([message], "red")
+
+    def _log_end_cursor(self):
+        """Return the log window's insertion cursor, moved to the end of the document."""
+        document = self.log_window.document()
+        cursor = self._log_cursor
+        if cursor is None or cursor.document() is not document:
+            cursor = self._log_cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        return cursor
+
+    def _append_log_run(self, lines, color, cursor=None):
+        """Append ``lines`` as new paragraphs in ``color`` at the end of the log window."""
+        if cursor is None:
+            cursor = self._log_end_cursor()
+        if not self.log_window.document().isEmpty():
+            cursor.insertBlock()
+        # insertText() turns each "\n" into a new block, so a whole run is a
+        # single insertion.
+        cursor.insertText("\n".join(lines), _char_format(color))
 
     log = log_message  # Alias for backward compatibility
 
@@ -194,38 +384,41 @@ class BaseAppController(QObject):
             return
         button.setEnabled(False)
         button.setText(text)
-        button.setStyleSheet("background-color: yellow; color: black;")
+        self._set_button_style(button, _RUNNING_BUTTON_STYLE)
 
     def _restore_button(self, button, original_style, text="Apply"):
         if not button:
             return
         button.setEnabled(True)
         button.setText(text)
-        if original_style:
-            button.setStyleSheet(original_style)
-        else:
-            button.setStyleSheet("")
+        # An empty style hands the button back to the application style
+        # sheet (resources/app.qss), e.g. its #primaryButton rule.
+        self._set_button_style(button, original_style or "")
+
+    @staticmethod
+    def _set_button_style(button, style):
+        # setStyleSheet() re-polishes the widget even when the sheet is unchanged.
+        if button.styleSheet() != style:
+            button.setStyleSheet(style)
 
     def _reset_task_button(self, context):
         if not context:
             return
-        self._restore_button(
-            context.get("button"),
-            context.get("button_style"),
-            context.get("button_reset_text", "Apply"),
-        )
+        self._restore_button(context.button, context.button_style, context.button_reset_text)
 
     def register_task_handlers(self, *, finished=None, errored=None):
         finished = finished or {}
         errored = errored or {}
 
+        # Keys are interned so lookups with the literal "type" strings used in
+        # task metadata hit the identity fast path.
         for task_type, handler in finished.items():
             if callable(handler):
-                self._task_finished_handlers[task_type] = handler
+                self._task_finished_handlers[sys.intern(task_type)] = handler
 
         for task_type, handler in errored.items():
             if callable(handler):
-                self._task_error_handlers[task_type] = handler
+                self._task_error_handlers[sys.intern(task_type)] = handler
 
     def _submit_task(
         self,
@@ -238,6 +431,7 @@ class BaseAppController(QObject):
         working_dir=None,
         description=None,
         env=None,
+        use_worker=False,
     ):
         # Set the project file and log path as soon as a task with an input path is submitted.
         # This ensures that all subsequent logging for this project context is captured.
@@ -245,35 +439,95 @@ class BaseAppController(QObject):
             self.project_file = input_path
             self.set_project_log_path(input_path)
 
+        context = TaskContext.from_metadata(metadata)
         try:
             task_id, _ = self.script_runner.run_task(
                 command,
-                metadata=metadata,
+                metadata=context,
+                retries=retries,
+                input_path=input_path,
+                output_path=output_path,
+                working_dir=working_dir,
+                description=description or context.description,
+                env=env,
+                use_worker=use_worker,
+            )
+        except Exception as exc:
+            self.log(f"Failed to start external task: {exc}", "red")
+            self._reset_task_button(context)
+            return None
+
+        self.task_contexts[task_id] = context
+        return task_id
+
+    def _submit_chain(
+        self,
+        commands,
+        *,
+        metadata,
+        retries=0,
+        input_path=None,
+        output_path=None,
+        working_dir=None,
+        description=None,
+        env=None,
+        use_worker=False,
+    ):
+        """Submit commands that run back to back and report as a single task."""
+        if input_path and os.path.exists(input_path):
+            self.project_file = input_path
+            self.set_project_log_path(input_path)
+
+        context = TaskContext.from_metadata(metadata)
+        try:
+            task_id = self.script_runner.run_chain(
+                commands,
+                metadata=context,
                 retries=retries,
                 input_path=input_path,
                 output_path=output_path,
                 working_dir=working_dir,
-                description=description or metadata.get("description"),
+                description=description or context.description,
                 env=env,
+                use_worker=use_worker,
             )
         except Exception as exc:
             self.log(f"Failed to start external task: {exc}", "red")
-            button = metadata.get("button")
-            self._restore_button(button, metadata.get("button_style"), metadata.get("button_reset_text", "Apply"))
+            self._reset_task_button(context)
             return None
 
-        self.task_contexts[task_id] = metadata
+        self.task_contexts[task_id] = context
         return task_id
 
     def _resolve_relative_path(self, path):
         if not path:
             return path
-        if os.path.isabs(path):
-            return os.path.normpath(path)
-        return os.path.normpath(os.path.join(self.project_root, path))
+        return _resolve_path(self._project_root_norm, path)
+
+    @property
+    def actions_config(self):
+        return self._actions_config
+
+    @actions_config.setter
+    def actions_config(self, value):
+        self._actions_config = value
+        self._action_spec_cache.clear()
 
     def get_action_spec(self, action, *, tab_name=None):
-        """Return script metadata for a given action, falling back to default scripts directory."""
+        """Return script metadata for a given action, falling back to default scripts directory.
+
+        Specs are resolved once per ``(action, tab_name)`` and returned as a
+        read-only mapping; assigning ``actions_config`` clears the cache.
+        """
+        key = (action, tab_name)
+        spec = self._action_spec_cache.get(key)
+        if spec is None:
+            spec = self._action_spec_cache[key] = MappingProxyType(
+                self._resolve_action_spec(action, tab_name)
+            )
+        return spec
+
+    def _resolve_action_spec(self, action, tab_name):
         spec = None
         if tab_name:
             tab_actions = self.actions_config.get(tab_name)
@@ -294,13 +548,10 @@ class BaseAppController(QObject):
             script_path = f"{action}.py"
 
         base_dir = spec.get("base_dir")
-        if os.path.isabs(script_path):
-            resolved_script = os.path.normpath(script_path)
-        elif base_dir:
-            resolved_base = self._resolve_relative_path(base_dir)
-            resolved_script = os.path.normpath(os.path.join(resolved_base, script_path))
+        if base_dir:
+            resolved_script = _resolve_path(self._resolve_relative_path(base_dir), script_path)
         else:
-            resolved_script = os.path.normpath(os.path.join(self.scripts_dir, script_path))
+            resolved_script = _resolve_path(self.scripts_dir, script_path)
         spec["script"] = resolved_script
 
         working_dir = spec.get("working_dir")
@@ -310,16 +561,120 @@ class BaseAppController(QObject):
         args = spec.get("args")
         if args is not None:
             if isinstance(args, (str, bytes)):
-                spec["args"] = [str(args)]
+                spec["args"] = (str(args),)
             else:
-                spec["args"] = [str(item) for item in args]
+                spec["args"] = tuple(str(item) for item in args)
 
         env = spec.get("env")
         if env and isinstance(env, dict):
-            spec["env"] = {str(key): str(value) for key, value in env.items()}
+            spec["env"] = MappingProxyType({str(key): str(value) for key, value in env.items()})
 
         return spec
 
+    def build_script_command(self, action, *args, tab_name=None):
+        """Return ``(command, action_spec)`` for running ``action``'s script.
+
+        The command is ``[python, script, *args]`` followed by any extra
+        ``args`` configured for the action.
+        """
+        action_spec = self.get_action_spec(action, tab_name=tab_name)
+        command = [self.python_executable, action_spec["script"], *args]
+        if action_spec.get("args"):
+            command.extend(action_spec["args"])
+        return command, action_spec
+
+    def run_script(
+        self,
+        action,
+        *args,
+        tab_name=None,
+        description=None,
+        button=None,
+        button_style="",
+        button_reset_text="Apply",
+        input_path=None,
+        output_path=None,
+    ):
+        """Submit ``action``'s script with ``args`` as a task of type ``action``.
+
+        ``button`` is reset by the task handlers once the task ends. The
+        script runs in the shared worker interpreter only if its action spec
+        sets ``"worker": true``. Returns the task id, or None if the task
+        could not be submitted.
+        """
+        command, action_spec = self.build_script_command(action, *args, tab_name=tab_name)
+        metadata = self._task_metadata(action, description, button, button_style, button_reset_text)
+        return self._submit_task(
+            command,
+            metadata=metadata,
+            input_path=input_path,
+            output_path=output_path,
+            description=description,
+            working_dir=action_spec.get("working_dir"),
+            env=action_spec.get("env"),
+            use_worker=bool(action_spec.get("worker")),
+        )
+
+    def run_script_chain(
+        self,
+        task_type,
+        actions,
+        *args,
+        tab_name=None,
+        description=None,
+        button=None,
+        button_style="",
+        button_reset_text="Apply",
+        input_path=None,
+        output_path=None,
+    ):
+        """Like :meth:`run_script`, but runs several actions back to back as one task.
+
+        The actions share one task, so their ``working_dir`` and ``env`` must
+        match; the chain uses the worker only if every action opts in.
+        """
+        actions = list(actions)
+        if not actions:
+            raise ValueError("run_script_chain() needs at least one action.")
+        commands = []
+        action_spec = None
+        use_worker = True
+        for action in actions:
+            command, spec = self.build_script_command(action, *args, tab_name=tab_name)
+            if action_spec is None:
+                action_spec = spec
+            elif (spec.get("working_dir"), spec.get("env")) != (
+                action_spec.get("working_dir"),
+                action_spec.get("env"),
+            ):
+                raise ValueError(
+                    f"Action '{action}' does not share the working_dir/env of '{actions[0]}' "
+                    "and cannot run in the same chain."
+                )
+            use_worker = use_worker and bool(spec.get("worker"))
+            commands.append(command)
+        metadata = self._task_metadata(task_type, description, button, button_style, button_reset_text)
+        return self._submit_chain(
+            commands,
+            metadata=metadata,
+            input_path=input_path,
+            output_path=output_path,
+            description=description,
+            working_dir=action_spec.get("working_dir"),
+            env=action_spec.get("env"),
+            use_worker=use_worker,
+        )
+
+    @staticmethod
+    def _task_metadata(task_type, description, button, button_style, button_reset_text):
+        return TaskContext(
+            type=task_type,
+            description=description,
+            button=button,
+            button_style=button_style,
+            button_reset_text=button_reset_text,
+        )
+
     def run_external_script(
         self,
         command,
@@ -331,6 +686,7 @@ class BaseAppController(QObject):
         working_dir=None,
         description=None,
         env=None,
+        use_worker=False,
     ):
         """Public helper so tabs can enqueue external scripts through the controller."""
         return self._submit_task(
@@ -342,16 +698,19 @@ class BaseAppController(QObject):
             working_dir=working_dir,
             description=description,
             env=env,
+            use_worker=use_worker,
         )
 
+    @Slot(str, int, object)
     def on_task_started(self, task_id, attempt, metadata):
         """Handle the start of an external task."""
-        metadata["attempt"] = attempt
+        metadata.attempt = attempt
 
+    @Slot(str, int, object)
     def on_task_finished(self, task_id, exit_code, metadata):
         """Handle the successful completion of an external task."""
-        context = self.task_contexts.pop(task_id, metadata or {})
-        task_type = context.get("type")
+        context = self.task_contexts.pop(task_id, None) or metadata
+        task_type = context.type
         handler = self._task_finished_handlers.get(task_type)
 
         if handler:
@@ -360,11 +719,12 @@ class BaseAppController(QObject):
             self._reset_task_button(context)
             self.log(f"Task '{task_type}' finished.")
 
+    @Slot(str, int, str, object)
     def on_task_error(self, task_id, exit_code, message, metadata):
         """Handle a failed external task."""
-        context = self.task_contexts.pop(task_id, metadata or {})
+        context = self.task_contexts.pop(task_id, None) or metadata
         log_message = message or f"Task failed with exit code {exit_code}."
-        task_type = context.get("type")
+        task_type = context.type
         handler = self._task_error_handlers.get(task_type)
 
         if handler:
@@ -373,31 +733,44 @@ class BaseAppController(QObject):
             self._reset_task_button(context)
             self.log(f"Task '{task_type}' failed: {log_message}", "red")
 
+    @Slot(str, str, str, object)
     def on_task_log_message(self, task_id, level, message, metadata):
         """Log messages from an external task."""
-        if level == "debug":
-            return
-
-        color = None
-        if level == "error":
-            color = "red"
-        elif level == "warning":
-            color = "orange"
+        # Output below the configured level is already dropped by the runner.
+        if self.log_window is None and self.project_log_path is None and level != "error":
+            return  # nowhere to show it
 
-        prefix = metadata.get("description")
-        formatted = f"[{prefix}] {message}" if prefix else message
+        color = _LEVEL_COLORS.get(level)
+        prefix = metadata.description
+        # A message may hold several lines of output; prefix each of them.
+        formatted = f"[{prefix}] " + message.replace("\n", f"\n[{prefix}] ") if prefix else message
 
         self.log(formatted, color)
 
     def get_global_settings(self):
         """Load global settings."""
-        return self.state_store.load("_global")
+        settings = self.state_store.load("_global")
+        settings.update(self._pending_global_settings)
+        return settings
 
     def set_global_setting(self, key, value):
         """Save a global setting."""
-        settings = self.get_global_settings()
-        settings[key] = value
-        self.state_store.save("_global", settings)
+        self._pending_global_settings[key] = value
+        self._settings_save_timer.start()
+
+    def _save_global_settings(self):
+        """Write pending global setting changes to disk."""
+        self._settings_save_timer.stop()
+        if not self._pending_global_settings:
+            return
+        settings = self.state_store.load("_global")
+        settings.update(self._pending_global_settings)
+        try:
+            self.state_store.save("_global", settings)
+        except OSError as exc:
+            self.log(f"Could not save global settings: {exc}", "red")
+            return
+        self._pending_global_settings.clear()
 
     def get_config_path(self):
         """Get the path to the app's config.json file."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Iterable, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 
 class TabContext:
@@ -13,6 +13,8 @@ class TabContext:
     consistent place to document the supported operations.
     """
 
+    __slots__ = ("_controller", "_tab_name", "_allowed_events", "_dispatch")
+
     def __init__(
         self,
         controller: "BaseAppController",
@@ -22,9 +24,12 @@ class TabContext:
     ) -> None:
         self._controller = controller
         self._tab_name = tab_name
-        self._allowed_events: Optional[Set[str]] = (
-            set(allowed_events) if allowed_events else None
+        # None means every event is allowed. A frozenset passed in by the
+        # controller is reused as is rather than copied.
+        self._allowed_events: Optional[FrozenSet[str]] = (
+            frozenset(allowed_events) if allowed_events else None
         )
+        self._dispatch = controller.dispatch_tab_event
 
     # ------------------------------------------------------------------
     # Basic metadata helpers
@@ -122,12 +127,26 @@ class TabContext:
     # ------------------------------------------------------------------
     # External task helpers
     # ------------------------------------------------------------------
-    def get_action_spec(self, action: str, *, tab_name: Optional[str] = None) -> Dict[str, Any]:
+    def get_action_spec(self, action: str, *, tab_name: Optional[str] = None) -> Mapping[str, Any]:
         return self._controller.get_action_spec(action, tab_name=tab_name)
 
+    def build_script_command(
+        self, action: str, *args: str, tab_name: Optional[str] = None
+    ) -> Tuple[List[str], Mapping[str, Any]]:
+        return self._controller.build_script_command(action, *args, tab_name=tab_name)
+
+    def run_script(self, action: str, *args: str, **kwargs: Any) -> Any:
+        return self._controller.run_script(action, *args, **kwargs)
+
+    def run_script_chain(self, task_type: str, actions: Iterable[str], *args: str, **kwargs: Any) -> Any:
+        return self._controller.run_script_chain(task_type, actions, *args, **kwargs)
+
     def submit_task(self, command: Iterable[str], *, metadata: Dict[str, Any], **kwargs: Any) -> Any:
         return self._controller._submit_task(command, metadata=metadata, **kwargs)
 
+    def submit_chain(self, commands: Iterable[Iterable[str]], *, metadata: Dict[str, Any], **kwargs: Any) -> Any:
+        return self._controller._submit_chain(commands, metadata=metadata, **kwargs)
+
     def set_button_running(self, button, text: str = "Running...") -> None:
         self._controller._set_button_running(button, text)
 
@@ -142,7 +161,7 @@ class TabContext:
             raise ValueError(
                 f"Tab '{self._tab_name}' attempted to publish unauthorized event '{event_name}'"
             )
-        self._controller.dispatch_tab_event(self._tab_name, event_name, payload or {})
+        self._dispatch(self._tab_name, event_name, payload)
 
     def subscribe(self, event_name: str, callback: Callable[[str, Dict[str, Any]], None]) -> None:
         self._controller.register_tab_listener(self._tab_name, event_name, callback)
@@ -0,0 +1,37 @@
+"""Per-task bookkeeping kept by the controller while a script runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Mapping, Optional
+
+
+@dataclass(slots=True)
+class TaskContext:
+    """What the controller needs to know about a submitted task.
+
+    The same object travels through the script runner as the task's
+    metadata and comes back in every started / finished / error / log
+    callback, so handlers read plain attributes instead of dict keys.
+    Keys without a dedicated field are kept in :attr:`extra`.
+    """
+
+    type: Optional[str] = None
+    description: Optional[str] = None
+    button: Any = None
+    button_style: Optional[str] = None
+    button_reset_text: str = "Apply"
+    attempt: int = 0
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_metadata(cls, metadata: Optional[Mapping[str, Any]]) -> "TaskContext":
+        """Build a context from a metadata dict, or return an existing context unchanged."""
+        if isinstance(metadata, cls):
+            return metadata
+        values = dict(metadata or {})
+        known = {name: values.pop(name) for name in _FIELD_NAMES if name in values}
+        return cls(**known, extra=values)
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(TaskContext) if f.name != "extra")
@@ -2,6 +2,9 @@ import os
 import sys
 import json
 import importlib
+import re
+import threading
+from collections.abc import Mapping
 from functools import partial
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -9,10 +12,88 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QGroupBox,
     QTabWidget,
-    QTextEdit,
+    QPlainTextEdit,
 )
 from PySide6.QtGui import QAction, QDesktopServices
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import QTimer, QUrl
+
+try:
+    from tabs.help import HelpTab
+except ImportError as exc:  # e.g. the "markdown" package is not installed
+    HelpTab = None
+    _HELP_IMPORT_ERROR = exc
+
+
+# Lines kept in the log panel; the project .log file keeps everything.
+DEFAULT_LOG_MAX_LINES = 5000
+
+# Set AEDT_DEV_RELOAD=1 to re-import an app's controller on every switch
+# (including re-selecting the active app) while developing it.
+DEV_RELOAD = os.environ.get("AEDT_DEV_RELOAD", "") not in ("", "0")
+
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+_APPS_DIR = os.path.join(os.path.dirname(_SRC_DIR), "apps")
+_STACKUP_EDITOR_PATH = os.path.join(_SRC_DIR, "tools", "stackup_editor.html")
+
+APP_STYLESHEET_PATH = os.path.join(_SRC_DIR, "resources", "app.qss")
+
+
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+
+
+def load_app_stylesheet(app):
+    """Apply resources/app.qss to the whole application (call once at startup)."""
+    try:
+        with open(APP_STYLESHEET_PATH, "r", encoding="utf-8") as f:
+            # Hand Qt's parser the sheet without comments and indentation.
+            app.setStyleSheet(" ".join(_QSS_COMMENT_RE.sub(" ", f.read()).split()))
+    except OSError as e:
+        print(f"Could not load style sheet {APP_STYLESHEET_PATH}: {e}", file=sys.stderr)
+
+
+class LazyTabs(Mapping):
+    """
+    Tab name -> tab widget, building each tab the first time it is looked up.
+
+    ``factories`` maps tab names to callables that create the widget;
+    ``on_created(name, tab)`` is called once for every tab that gets built.
+    A tab whose factory raises is reported through ``on_error(name, exc)``
+    and then behaves as if it were not configured.
+    """
+
+    def __init__(self, factories, on_created, on_error):
+        self._factories = dict(factories)
+        self._tabs = {}
+        self._on_created = on_created
+        self._on_error = on_error
+
+    def __getitem__(self, name):
+        tab = self._tabs.get(name)
+        if tab is None:
+            factory = self._factories[name]
+            try:
+                tab = factory()
+            except Exception as exc:
+                del self._factories[name]
+                self._on_error(name, exc)
+                raise KeyError(name) from exc
+            self._tabs[name] = tab
+            self._on_created(name, tab)
+        return tab
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self):
+        return len(self._factories)
+
+    def loaded(self):
+        """Return the tabs built so far."""
+        return dict(self._tabs)
+
+    def pending(self):
+        """Return the names of the tabs not built yet, in tab order."""
+        return [name for name in self._factories if name not in self._tabs]
 
 
 class MainApplicationWindow(QMainWindow):
@@ -26,6 +107,16 @@ class MainApplicationWindow(QMainWindow):
         self.current_controller = None
         self.apps = {}
         self.first_app_name = None
+        self._config_cache = {}  # path -> (mtime, parsed config)
+        self._tab_classes = {}  # tab name -> tab widget class
+        self._all_tab_names = set()  # tabs used by any discovered app
+        self._active_app = None  # app whose controller and tabs loaded successfully
+        self._controller_mtimes = {}  # controller module name -> mtime of its loaded source
+        self._stackup_editor_url = None  # QUrl, once the editor file has been found
+        self._log_replaced = None  # (text, document revision) after the last _log(replace=True)
+        self._lazy_tabs = None
+        self._tab_placeholders = {}  # tab name -> placeholder widget
+        self._named_tabs = {}  # "Help"/"License" -> tab widget while shown
 
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -34,6 +125,7 @@ class MainApplicationWindow(QMainWindow):
         # --- Menu Bar ---
         menu_bar = self.menuBar()
         self.apps_menu = menu_bar.addMenu("Apps")
+        self.apps_menu.triggered.connect(self._on_app_action)
         self.tools_menu = menu_bar.addMenu("Tools")
         self.options_menu = menu_bar.addMenu("Options")
 
@@ -51,21 +143,28 @@ class MainApplicationWindow(QMainWindow):
 
         # Tabs
         self.tabs = QTabWidget()
+        self.tabs.currentChanged.connect(self._on_current_tab_changed)
         main_layout.addWidget(self.tabs)
 
         # Log Window
         log_group = QGroupBox("Information")
         log_group.setObjectName("logGroup")
         log_layout = QVBoxLayout(log_group)
-        self.log_window = QTextEdit()
+        self.log_window = QPlainTextEdit()
         self.log_window.setReadOnly(True)
+        # Let Qt discard the oldest lines instead of growing without bound.
+        # The limit can be changed with the "log_max_lines" global setting.
+        self.log_window.setMaximumBlockCount(DEFAULT_LOG_MAX_LINES)
         self.log_window.setObjectName("logWindow")
         log_layout.addWidget(self.log_window)
         main_layout.addWidget(log_group)
 
-        self.apply_styles()
         self.discover_apps()
 
+        # Import every app's tab modules in the background so that later app
+        # switches find them in sys.modules.
+        self._start_tab_import_warmup()
+
         # Load the first discovered app by default
         if self.first_app_name:
             self.switch_app(self.first_app_name)
@@ -74,46 +173,117 @@ class MainApplicationWindow(QMainWindow):
         """
         Opens the stackup editor HTML file in the default web browser.
         """
-        editor_path = os.path.join(os.path.dirname(__file__), "tools", "stackup_editor.html")
-        if os.path.exists(editor_path):
-            url = QUrl.fromLocalFile(os.path.abspath(editor_path))
-            QDesktopServices.openUrl(url)
+        editor_path = _STACKUP_EDITOR_PATH
+        if self._stackup_editor_url is None and os.path.exists(editor_path):
+            # Found once; later clicks reuse the URL without touching the disk.
+            self._stackup_editor_url = QUrl.fromLocalFile(editor_path)
+        if self._stackup_editor_url is not None:
+            QDesktopServices.openUrl(self._stackup_editor_url)
         else:
-            self.log_window.append(f"Error: Could not find stackup editor at {editor_path}")
+            self._log(f"Error: Could not find stackup editor at {editor_path}")
 
     def discover_apps(self):
         """
         Scans the 'apps' directory and populates the 'Apps' menu.
         """
-        apps_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "apps")
-        if not os.path.isdir(apps_dir):
+        # DirEntry.is_dir() is answered from the directory listing itself,
+        # and the config's stat() doubles as its existence check. A missing
+        # controller.py is reported by switch_app when the app is opened.
+        try:
+            with os.scandir(_APPS_DIR) as it:
+                app_dirs = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+        except FileNotFoundError:
             return
 
-        app_names = sorted(os.listdir(apps_dir))
-        for app_name in app_names:
-            app_path = os.path.join(apps_dir, app_name)
-            config_path = os.path.join(app_path, "config.json")
-            controller_path = os.path.join(app_path, "controller.py")
+        for entry in app_dirs:
+            app_name = entry.name
+            config_path = os.path.join(entry.path, "config.json")
+
+            try:
+                config = self._load_config(config_path)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"Could not load app '{app_name}': {e}")
+                continue
+
+            display_name = config.get("display_name", app_name)
+
+            if not self.first_app_name:
+                self.first_app_name = app_name
+
+            action = QAction(display_name, self)
+            action.setData(app_name)
+            self.apps_menu.addAction(action)
+            self.apps[app_name] = {
+                "display_name": display_name,
+                "path": entry.path,
+                "config_path": config_path,
+            }
+            tabs_config = config.get("tabs")
+            if isinstance(tabs_config, dict):
+                self._all_tab_names.update(tabs_config)
+
+    def _start_tab_import_warmup(self):
+        tab_names = sorted(self._all_tab_names)
+        if tab_names:
+            threading.Thread(
+                target=self._warm_tab_imports, args=(tab_names,), name="tab-import-warmup", daemon=True
+            ).start()
+
+    def _warm_tab_imports(self, tab_names):
+        # Only imports modules and resolves classes into self._tab_classes;
+        # widgets are still created on the GUI thread. Failures are left for
+        # _resolve_tab_class to report when the tab is built.
+        for tab_name in tab_names:
+            try:
+                self._resolve_tab_class(tab_name)
+            except Exception:
+                pass
+
+    def _reload_if_changed(self, module):
+        """Reload ``module`` if its source file changed since it was last (re)loaded."""
+        name = module.__name__
+        mtime = os.stat(module.__file__).st_mtime
+        loaded_mtime = self._controller_mtimes.setdefault(name, mtime)
+        if mtime == loaded_mtime:
+            return module
+        importlib.invalidate_caches()
+        module = importlib.reload(module)
+        self._controller_mtimes[name] = mtime
+        return module
+
+    def _on_app_action(self, action):
+        """Switch to the app whose name is stored in the triggered Apps-menu action."""
+        self.switch_app(action.data())
+
+    def _load_config(self, config_path):
+        """Return the parsed app config, re-reading the file only when it has changed."""
+        mtime = os.stat(config_path).st_mtime
+        cached = self._config_cache.get(config_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        # One read of the raw bytes; json.loads detects the UTF-8/16/32 encoding.
+        with open(config_path, "rb") as f:
+            config = json.loads(f.read())
+        self._config_cache[config_path] = (mtime, config)
+        return config
+
+    def _resolve_tab_class(self, tab_name):
+        """Return the widget class for ``tab_name`` (``tabs.<tab_name>.<TabName>``).
+
+        Also called from the import warm-up thread; both threads resolve the
+        same class, so a lookup racing with it at worst repeats the import.
+        """
+        tab_class = self._tab_classes.get(tab_name)
+        if tab_class is None:
+            tab_module = importlib.import_module(f"tabs.{tab_name}")
+            class_name = "".join(word.capitalize() for word in tab_name.split('_'))
+            tab_class = self._tab_classes[tab_name] = getattr(tab_module, class_name)
+        return tab_class
 
-            if os.path.isdir(app_path) and os.path.exists(config_path) and os.path.exists(controller_path):
-                try:
-                    with open(config_path, "r") as f:
-                        config = json.load(f)
-                        display_name = config.get("display_name", app_name)
-                        
-                        if not self.first_app_name:
-                            self.first_app_name = app_name
-
-                        action = QAction(display_name, self)
-                        action.triggered.connect(partial(self.switch_app, app_name))
-                        self.apps_menu.addAction(action)
-                        self.apps[app_name] = {
-                            "display_name": display_name,
-                            "config_path": config_path,
-                        }
-
-                except Exception as e:
-                    print(f"Could not load app '{app_name}': {e}")
+    def _build_tab(self, tab_name, tab_context):
+        return self._resolve_tab_class(tab_name)(tab_context)
 
     def switch_app(self, app_name):
         """
@@ -121,92 +291,155 @@ class MainApplicationWindow(QMainWindow):
         """
         if not app_name:
             return
+        if app_name == self._active_app and not DEV_RELOAD:
+            return  # re-selecting the active app would only discard its tab state
+        self._active_app = None
+
+        # Write the outgoing app's queued log lines and stop its script worker
+        if self.current_controller and hasattr(self.current_controller, "shutdown"):
+            self.current_controller.shutdown()
 
         # Clear existing tabs
+        self._lazy_tabs = None
+        self._tab_placeholders = {}
+        self._named_tabs = {}
         self.tabs.clear()
         self._update_window_title()
 
         # Dynamically import and instantiate the controller
         try:
-            # Invalidate caches to ensure the latest controller is loaded
-            importlib.invalidate_caches()
             controller_module_name = f"apps.{app_name}.controller"
-            
-            # If the module is already loaded, reload it
-            if controller_module_name in sys.modules:
-                controller_module = importlib.reload(sys.modules[controller_module_name])
-            else:
-                controller_module = importlib.import_module(controller_module_name)
+
+            controller_module = importlib.import_module(controller_module_name)
+            # In development mode, pick up edits to an already loaded controller
+            if DEV_RELOAD:
+                controller_module = self._reload_if_changed(controller_module)
 
             self.current_controller = controller_module.AppController(app_name)
             self.current_controller.log_window = self.log_window # Give controller access to the logger
+            self._apply_log_limit()
         except Exception as e:
-            self.log_window.setText(f"Error loading controller for '{app_name}': {e}")
+            self._log(f"Error loading controller for '{app_name}': {e}")
             return
 
         # Load app config and create tabs
-        app_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "apps", app_name)
-        config_path = os.path.join(app_path, "config.json")
         app_meta = self.apps.get(app_name, {})
+        app_path = app_meta.get("path") or os.path.join(_APPS_DIR, app_name)
+        config_path = os.path.join(app_path, "config.json")
 
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-                display_name = config.get("display_name", app_meta.get("display_name", app_name))
-                app_meta.update({
-                    "display_name": display_name,
-                    "config_path": config_path,
-                })
-                self.apps[app_name] = app_meta
-                self._update_window_title(display_name)
-
-                # Update the information panel with the app's description
-                self.log_window.clear()
-                description = config.get("description")
-                if description:
-                    self.log_window.setText(description)
-
-                tabs_config = config.get("tabs", {})
-                
-                loaded_tabs = {}
-                if isinstance(tabs_config, dict):
+            config = self._load_config(config_path)
+            display_name = config.get("display_name", app_meta.get("display_name", app_name))
+            app_meta.update({
+                "display_name": display_name,
+                "path": app_path,
+                "config_path": config_path,
+            })
+            self.apps[app_name] = app_meta
+            self._update_window_title(display_name)
+
+            # Update the information panel with the app's description
+            self._log(config.get("description") or "", replace=True)
+
+            tabs_config = config.get("tabs", {})
+            
+            # Tabs start as empty placeholders. The first one is imported and
+            # built right away, any other as soon as the controller or the user
+            # asks for it, and the rest one per event-loop turn after the switch.
+            factories = {}
+            if isinstance(tabs_config, dict):
+                was_blocked = self.tabs.blockSignals(True)
+                try:
                     for tab_name, display_title in tabs_config.items():
-                        tab_module_name = f"tabs.{tab_name}"
-                        tab_module = importlib.import_module(tab_module_name)
-                        
-                        class_name = "".join(word.capitalize() for word in tab_name.split('_'))
-                        tab_class = getattr(tab_module, class_name)
-                        
                         tab_context = self.current_controller.create_tab_context(tab_name)
-                        tab_instance = tab_class(tab_context)
-                        self.tabs.addTab(tab_instance, display_title)
-                        loaded_tabs[tab_name] = tab_instance
-                
-                if hasattr(self.current_controller, "connect_signals"):
-                    self.current_controller.connect_signals(loaded_tabs)
-                
-                if hasattr(self.current_controller, "load_config"):
-                    self.current_controller.load_config()
-
-                if self.help_action.isChecked():
-                    self.toggle_help_tab(True)
-
-                if self.license_action.isChecked():
-                    self.toggle_license_tab(True)
+                        factories[tab_name] = partial(self._build_tab, tab_name, tab_context)
+                        placeholder = QWidget()
+                        self._tab_placeholders[tab_name] = placeholder
+                        self.tabs.addTab(placeholder, display_title)
+                finally:
+                    self.tabs.blockSignals(was_blocked)
+
+            controller = self.current_controller
+            loaded_tabs = LazyTabs(
+                factories,
+                on_created=partial(self._on_tab_created, controller),
+                on_error=self._on_tab_error,
+            )
+            self._lazy_tabs = loaded_tabs
+
+            if hasattr(self.current_controller, "connect_signals"):
+                self.current_controller.connect_signals(loaded_tabs)
+
+            # Configuration is loaded before any tab exists; each tab picks
+            # up its saved settings through the controller when it is built.
+            if hasattr(self.current_controller, "load_config"):
+                self.current_controller.load_config()
+
+            if factories:
+                loaded_tabs.get(next(iter(factories)))
+
+            if self.help_action.isChecked():
+                self.toggle_help_tab(True)
+
+            if self.license_action.isChecked():
+                self.toggle_license_tab(True)
+
+            if loaded_tabs.pending():
+                QTimer.singleShot(0, partial(self._build_next_tab, loaded_tabs))
+
+            self._active_app = app_name
 
         except Exception as e:
             self._update_window_title()
-            self.log_window.setText(f"Error loading tabs for '{app_name}': {e}")
+            self._log(f"Error loading tabs for '{app_name}': {e}")
             return
 
+    def _build_next_tab(self, lazy_tabs):
+        """Build one deferred tab per event-loop turn so the window stays responsive."""
+        if lazy_tabs is not self._lazy_tabs:
+            return  # the app was switched in the meantime
+        pending = lazy_tabs.pending()
+        if not pending:
+            return
+        lazy_tabs.get(pending[0])
+        if len(pending) > 1:
+            QTimer.singleShot(0, partial(self._build_next_tab, lazy_tabs))
+
+    def _on_current_tab_changed(self, index):
+        """Build a deferred tab as soon as the user opens it."""
+        if self._lazy_tabs is None or index < 0:
+            return
+        widget = self.tabs.widget(index)
+        for tab_name, placeholder in self._tab_placeholders.items():
+            if placeholder is widget:
+                self._lazy_tabs.get(tab_name)
+                break
+
+    def _on_tab_created(self, controller, tab_name, tab):
+        """Put a freshly built tab in place of its placeholder and bind it."""
+        placeholder = self._tab_placeholders.pop(tab_name, None)
+        index = self.tabs.indexOf(placeholder) if placeholder is not None else -1
+        if index >= 0:
+            was_blocked = self.tabs.blockSignals(True)
+            try:
+                current = self.tabs.currentIndex()
+                title = self.tabs.tabText(index)
+                self.tabs.removeTab(index)
+                self.tabs.insertTab(index, tab, title)
+                self.tabs.setCurrentIndex(current)
+            finally:
+                self.tabs.blockSignals(was_blocked)
+            placeholder.deleteLater()
+        controller.bind_tab(tab, tab_name)
+
+    def _on_tab_error(self, tab_name, exc):
+        self._log(f"Error loading tab '{tab_name}': {exc}")
+
     def toggle_help_tab(self, enabled):
         """Shows or hides the help tab for the current application."""
         HELP_TAB_NAME = "Help"
         # First, remove any existing help tab to ensure a clean state
-        for i in range(self.tabs.count()):
-            if self.tabs.tabText(i) == HELP_TAB_NAME:
-                self.tabs.removeTab(i)
-                break
+        self._remove_named_tab(HELP_TAB_NAME)
 
         if not enabled:
             return
@@ -215,29 +448,32 @@ class MainApplicationWindow(QMainWindow):
             return
 
         app_name = self.current_controller.app_name
-        app_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "apps", app_name)
+        app_meta = self.apps.setdefault(app_name, {})
+        app_path = app_meta.get("path") or os.path.join(_APPS_DIR, app_name)
         help_file = os.path.join(app_path, "help.md")
 
-        if not os.path.exists(help_file):
+        # Whether the app ships a help.md is checked once per app.
+        if "has_help" not in app_meta:
+            app_meta["has_help"] = os.path.isfile(help_file)
+        if not app_meta["has_help"]:
             return
 
         try:
-            from tabs.help import HelpTab
+            if HelpTab is None:
+                raise _HELP_IMPORT_ERROR
             help_tab = HelpTab(self.current_controller)
             help_tab.load_help_content(help_file)
             self.tabs.addTab(help_tab, HELP_TAB_NAME)
+            self._named_tabs[HELP_TAB_NAME] = help_tab
             self.tabs.setCurrentIndex(self.tabs.count() - 1)
         except Exception as e:
-            self.log_window.append(f"Could not load help tab: {e}")
+            self._log(f"Could not load help tab: {e}")
 
     def toggle_license_tab(self, enabled):
         """Shows or hides the license tab."""
         LICENSE_TAB_NAME = "License"
         # First, remove any existing license tab to ensure a clean state
-        for i in range(self.tabs.count()):
-            if self.tabs.tabText(i) == LICENSE_TAB_NAME:
-                self.tabs.removeTab(i)
-                break
+        self._remove_named_tab(LICENSE_TAB_NAME)
 
         if not enabled:
             return
@@ -246,13 +482,50 @@ class MainApplicationWindow(QMainWindow):
             from tabs.license_tab import LicenseTab
             license_tab = LicenseTab(self.current_controller)
             self.tabs.addTab(license_tab, LICENSE_TAB_NAME)
+            self._named_tabs[LICENSE_TAB_NAME] = license_tab
             self.tabs.setCurrentIndex(self.tabs.count() - 1)
         except Exception as e:
-            self.log_window.append(f"Could not load license tab: {e}")
+            self._log(f"Could not load license tab: {e}")
+
+    def _log(self, message, *, replace=False):
+        """Append ``message`` to the log panel, or make it the panel's only text.
+
+        Replacing with the text that is already shown (e.g. the same error on
+        a retried app switch) is skipped instead of resetting the document.
+        """
+        if not replace:
+            self.log_window.appendPlainText(message)
+            return
+        document = self.log_window.document()
+        if self._log_replaced == (message, document.revision()):
+            return
+        self.log_window.setPlainText(message)
+        self._log_replaced = (message, document.revision())
+
+    def _remove_named_tab(self, name):
+        """Remove the Help/License tab added under ``name``, if it is shown."""
+        widget = self._named_tabs.pop(name, None)
+        if widget is None:
+            return
+        index = self.tabs.indexOf(widget)
+        if index >= 0:
+            self.tabs.removeTab(index)
+        widget.deleteLater()
+
+    def _apply_log_limit(self):
+        """Apply the "log_max_lines" global setting (0 = unlimited) to the log panel."""
+        settings = self.current_controller.get_global_settings()
+        try:
+            max_lines = int(settings.get("log_max_lines", DEFAULT_LOG_MAX_LINES))
+        except (TypeError, ValueError):
+            max_lines = DEFAULT_LOG_MAX_LINES
+        self.log_window.setMaximumBlockCount(max(0, max_lines))
 
     def closeEvent(self, event):
         if self.current_controller and hasattr(self.current_controller, "save_config"):
             self.current_controller.save_config()
+        if self.current_controller and hasattr(self.current_controller, "shutdown"):
+            self.current_controller.shutdown()
         super().closeEvent(event)
 
     def _update_window_title(self, app_display_name=None):
@@ -260,36 +533,3 @@ class MainApplicationWindow(QMainWindow):
             self.setWindowTitle(f"{self.BASE_TITLE} - {app_display_name}")
         else:
             self.setWindowTitle(self.BASE_TITLE)
-
-    def apply_styles(self):
-        self.setStyleSheet("""
-            QPushButton {
-                padding: 5px 10px;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                background-color: #f0f0f0;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QGroupBox#logGroup {
-                padding: 12px 2px 2px 2px;
-                margin: 10px 0 0 0;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-            }
-            QGroupBox#logGroup::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-                left: 4px;
-            }
-            QTextEdit#logWindow {
-                border: none;
-                padding: 0;
-                margin: 0;
-            }
-        """)
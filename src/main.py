@@ -6,10 +6,15 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from PySide6.QtWidgets import QApplication
-from src.gui import MainApplicationWindow
 
 if __name__ == "__main__":
+    # Create the application before importing the GUI so Qt's start-up work
+    # (platform plugin, fonts) is done before gui.py and the tabs are loaded.
     app = QApplication(sys.argv)
+
+    from src.gui import MainApplicationWindow, load_app_stylesheet
+
+    load_app_stylesheet(app)
     window = MainApplicationWindow()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
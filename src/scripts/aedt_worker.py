@@ -0,0 +1,120 @@
+"""Long-lived interpreter that runs automation scripts on request.
+
+Importing pyaedt / pyedb takes several seconds, and every helper script used
+to pay that cost in a fresh ``python.exe``. This worker stays alive for the
+lifetime of the GUI and executes scripts in-process, so heavy modules are
+imported once and reused by every following task.
+
+Protocol (one JSON object per line):
+
+* stdin  -> ``{"task_id": ..., "steps": [{"script": ..., "args": [...]}, ...],
+  "cwd": ..., "env": {...}}``
+* stdout -> the scripts' own output, followed by
+  ``@@aedt-worker@@ {"event": "done", "task_id": ..., "exit_code": ...}``
+
+Each script runs as ``__main__`` with ``sys.argv``, the working directory and
+environment variables set as if it had been started on its own. The steps of
+one request run back to back and stop at the first non-zero exit code, which
+is then reported for the whole request.
+
+Module globals, ``sys.modules`` and anything the scripts leave open persist
+from one request to the next, so the runner only sends scripts whose action
+spec opts in with ``"worker": true``. Cancelling a request kills the worker.
+"""
+
+import json
+import os
+import runpy
+import sys
+import traceback
+
+EVENT_PREFIX = "@@aedt-worker@@ "
+
+
+def _exit_code(exc):
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_script(script, args=(), cwd=None, env=None):
+    """Execute ``script`` as ``__main__`` and return its exit code."""
+    saved_argv = sys.argv
+    saved_path = list(sys.path)
+    saved_cwd = os.getcwd()
+    saved_env = {key: os.environ.get(key) for key in (env or {})}
+
+    sys.argv = [script, *args]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    if cwd:
+        os.chdir(cwd)
+    for key, value in (env or {}).items():
+        os.environ[key] = value
+
+    try:
+        runpy.run_path(script, run_name="__main__")
+        return 0
+    except SystemExit as exc:
+        return _exit_code(exc)
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        os.chdir(saved_cwd)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def emit(event, **payload):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    # Start on a fresh line in case the script's last output had no newline;
+    # the runner ignores the resulting empty line.
+    print("\n" + EVENT_PREFIX + json.dumps({"event": event, **payload}), flush=True)
+
+
+def main():
+    # Route stderr into stdout so script output and the completion event
+    # reach the GUI in the order they were written.
+    os.dup2(sys.stdout.fileno(), sys.stderr.fileno())
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            emit("error", message=f"Invalid request: {exc}")
+            continue
+
+        steps = request.get("steps")
+        if not steps or not all(step.get("script") for step in steps):
+            print("Invalid request: no script given.", file=sys.stderr)
+            emit("done", task_id=request.get("task_id"), exit_code=2)
+            continue
+
+        exit_code = 0
+        for step in steps:
+            exit_code = run_script(
+                step["script"],
+                step.get("args") or [],
+                cwd=request.get("cwd"),
+                env=request.get("env"),
+            )
+            if exit_code != 0:
+                break
+        emit("done", task_id=request.get("task_id"), exit_code=exit_code)
+
+
+if __name__ == "__main__":
+    main()
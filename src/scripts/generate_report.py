@@ -1,69 +1,61 @@
 import json
 import sys
 
-def generate_html_report(project_file):
-    try:
-        with open(project_file, "r") as f:
-            project_data = json.load(f)
+import numpy as np
 
-        results = project_data.get("result", {})
-        if not results:
-            print("No results found in project file.")
-            return
+try:
+    import orjson
+
+    def load_json(f):
+        return orjson.loads(f.read())
+except ImportError:
+    load_json = json.load
 
-        plot_data = {}
-        for signal, data in results.items():
-            plot_data[signal] = {
-                'insertion_loss_freq': [f / 1e9 for f in data['insertion_loss']['freq']],
-                'insertion_loss_val': data['insertion_loss']['insetion loss'],
-                'return_loss_freq': [f / 1e9 for f in data['return_loss']['freq']],
-                'return_loss_val': data['return_loss']['return loss']
-            }
 
-        # Generate sidebar items separately to avoid f-string parsing issues
-        sidebar_items = ''.join([
-            f'<label class="signal-item" onmouseover=\'highlightTrace({json.dumps(s)})\' onmouseout=\'unhighlightTrace()\'><input type="checkbox" name="signal" value="{s}" onchange="updatePlot()">{s}</label>' 
-            for s in results.keys()
-        ])
+def _ghz(freqs):
+    """Convert a list of frequencies in Hz to GHz."""
+    return (np.asarray(freqs, dtype=np.float64) / 1e9).tolist()
 
-        html_content = f"""
+
+_HTML_BEFORE_SIDEBAR = """
 <!DOCTYPE html>
 <html>
 <head>
+    <meta charset="utf-8">
     <title>Simulation Results</title>
     <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
     <style>
-        body {{ 
+        body { 
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
             margin: 0;
             display: flex;
             height: 100vh;
             background-color: #f8f9fa;
-        }}
-        #sidebar {{
+        }
+        #sidebar {
             width: 280px;
             background-color: #ffffff;
             padding: 20px;
             overflow-y: auto;
             border-right: 1px solid #dee2e6;
             box-shadow: 0 0 10px rgba(0,0,0,0.05);
-        }}
-        #plot-container {{
+        }
+        #plot-container {
             flex-grow: 1;
             padding: 20px;
             display: flex;
             flex-direction: column;
-        }}
-        #plot {{
+        }
+        #plot {
             width: 100%;
             flex-grow: 1;
-        }}
-        h2 {{
+        }
+        h2 {
             font-size: 1.5em;
             color: #343a40;
             margin-top: 0;
-        }}
-        .signal-item {{
+        }
+        .signal-item {
             display: block;
             margin-bottom: 10px;
             font-size: 1.2em;
@@ -71,13 +63,13 @@ def generate_html_report(project_file):
             cursor: pointer;
             padding: 5px;
             border-radius: 4px;
-        }}
-        .signal-item:hover {{
+        }
+        .signal-item:hover {
             background-color: #e9ecef;
-        }}
-        input[type="checkbox"] {{
+        }
+        input[type="checkbox"] {
             margin-right: 10px;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -86,80 +78,84 @@ def generate_html_report(project_file):
         <label class="signal-item"><input type="checkbox" id="toggle-il" onchange="updatePlot()" checked>Insertion Loss</label>
         <label class="signal-item"><input type="checkbox" id="toggle-rl" onchange="updatePlot()" checked>Return Loss</label>
         <h2>Signals</h2>
-        {sidebar_items}
+        """
+
+_HTML_BEFORE_PLOT_DATA = """
     </div>
     <div id="plot-container">
         <div id="plot"></div>
     </div>
 
     <script>
-        const plotData = {json.dumps(plot_data)};
+        const plotData = """
 
-        function highlightTrace(signal) {{
+_HTML_AFTER_PLOT_DATA = """;
+
+        function highlightTrace(signal) {
             const plotDiv = document.getElementById('plot');
             if (!plotDiv.data) return;
 
-            const updates = plotDiv.data.map(trace => {{
+            const updates = plotDiv.data.map(trace => {
                 const isHighlighted = trace.name.startsWith(signal);
-                return {{
-                    line: {{ width: isHighlighted ? 4 : undefined }},
+                return {
+                    line: { width: isHighlighted ? 4 : undefined },
                     opacity: isHighlighted ? 1.0 : 0.3
-                }};
-            }});
+                };
+            });
 
             Plotly.restyle('plot', updates);
-        }}
+        }
 
-        function unhighlightTrace() {{
+        function unhighlightTrace() {
             const plotDiv = document.getElementById('plot');
             if (!plotDiv.data) return;
 
-            const updates = plotDiv.data.map(() => ({{
-                line: {{ width: undefined }},
+            const updates = plotDiv.data.map(() => ({
+                line: { width: undefined },
                 opacity: 1.0
-            }}));
+            }));
             
             Plotly.restyle('plot', updates);
-        }}
+        }
 
-        function updatePlot() {{
+        function updatePlot() {
             const selectedSignals = Array.from(document.querySelectorAll('input[name="signal"]:checked')).map(cb => cb.value);
             const showIL = document.getElementById('toggle-il').checked;
             const showRL = document.getElementById('toggle-rl').checked;
             const traces = [];
 
-            selectedSignals.forEach(signal => {{
+            selectedSignals.forEach(signal => {
                 const data = plotData[signal];
-                if (showIL) {{
-                    traces.push({{
+                if (showIL) {
+                    traces.push({
                         x: data.insertion_loss_freq,
                         y: data.insertion_loss_val,
                         mode: 'lines',
-                        name: `${{signal}} - IL`,
-                    }});
-                }}
-                if (showRL) {{
-                    traces.push({{
+                        name: `${signal} - IL`,
+                    });
+                }
+                if (showRL) {
+                    traces.push({
                         x: data.return_loss_freq,
                         y: data.return_loss_val,
                         mode: 'lines',
-                        name: `${{signal}} - RL`,
-                    }});
-                }}
-            }});
+                        name: `${signal} - RL`,
+                    });
+                }
+            });
 
-            const layout = {{
+            const layout = {
                 title: 'Signal Loss Analysis',
-                xaxis: {{ title: 'Frequency (GHz)' }},
-                yaxis: {{ title: 'Loss (dB)' }},
+                xaxis: { title: 'Frequency (GHz)' },
+                yaxis: { title: 'Loss (dB)' },
                 hovermode: 'x unified',
-                font: {{
+                font: {
                     size: 14
-                }}
-            }};
+                }
+            };
 
-            Plotly.newPlot('plot', traces, layout, {{responsive: true}});
-        }}
+            Plotly.newPlot('plot', traces, layout, {responsive: true});
+        }
 
         // Initial plot
         updatePlot();
@@ -167,9 +163,43 @@ def generate_html_report(project_file):
 </body>
 </html>
 """
+
+_SIDEBAR_ITEM = (
+    '<label class="signal-item" onmouseover=\'highlightTrace({signal_json})\' onmouseout=\'unhighlightTrace()\'>'
+    '<input type="checkbox" name="signal" value="{signal}" onchange="updatePlot()">{signal}</label>'
+)
+
+
+def generate_html_report(project_file):
+    try:
+        with open(project_file, "rb") as f:
+            project_data = load_json(f)
+
+        results = project_data.get("result", {})
+        if not results:
+            print("No results found in project file.")
+            return
+
+        plot_data = {}
+        for signal, data in results.items():
+            plot_data[signal] = {
+                'insertion_loss_freq': _ghz(data['insertion_loss']['freq']),
+                'insertion_loss_val': data['insertion_loss']['insetion loss'],
+                'return_loss_freq': _ghz(data['return_loss']['freq']),
+                'return_loss_val': data['return_loss']['return loss']
+            }
+
+        # The report is written piece by piece so the page and the embedded
+        # plot data never have to exist as one string in memory.
         report_path = project_file.replace("project.json", "report.html")
-        with open(report_path, "w") as f:
-            f.write(html_content)
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(_HTML_BEFORE_SIDEBAR)
+            f.write("".join(
+                _SIDEBAR_ITEM.format(signal_json=json.dumps(s), signal=s) for s in results
+            ))
+            f.write(_HTML_BEFORE_PLOT_DATA)
+            json.dump(plot_data, f, separators=(",", ":"))
+            f.write(_HTML_AFTER_PLOT_DATA)
         print(f"HTML report generated at: {report_path}")
 
     except Exception as e:
@@ -1,8 +1,23 @@
+import os
 import sys
-import json
+import numpy as np
 import skrf as rf
-from collections import defaultdict
-from pyaedt import Circuit
+
+try:
+    import orjson
+
+    def load_json(f):
+        return orjson.loads(f.read())
+
+    def dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    import json
+
+    load_json = json.load
+
+    def dump_json(obj):
+        return json.dumps(obj, default=lambda value: value.tolist()).encode("utf-8")
 
 #json_path = sys.argv[1]
 if len(sys.argv) > 1:
@@ -10,91 +25,99 @@ if len(sys.argv) > 1:
 else:
     json_path = r"D:\OneDrive - ANSYS, Inc\a-client-repositories\lmz-siwave-SI-2025-10-17\test\project.json"
 
-with open(json_path) as f:
-    info = json.load(f)
+with open(json_path, 'rb') as f:
+    info = load_json(f)
 
-if "touchstone_path" not in info or not info["touchstone_path"]:
-    print("Error: 'touchstone_path' not found in project.json.")
+# run_sim.py exports next to the design without recording the path. The
+# export for the current port count wins over a stored touchstone_path,
+# which may point at the file of an earlier run with fewer or more ports.
+snp_path = None
+if info.get("aedb_path") and info.get("ports"):
+    snp_path = os.path.join(os.path.dirname(info["aedb_path"]), f'model.s{len(info["ports"])}p')
+if not snp_path or not os.path.exists(snp_path):
+    snp_path = info.get("touchstone_path")
+
+if not snp_path or not os.path.exists(snp_path):
+    print("Error: Touchstone file not found for this project.")
     print("Please ensure the simulation has completed successfully before running post-processing.")
     sys.exit(1)
 
-snp_path = info["touchstone_path"]
+# (net_type, component_role, polarity) -> (side, position) of the port's
+# sequence number; side 0 is the controller end, 1 the DRAM end, and
+# position picks the positive / negative leg of a differential pair.
+PORT_SLOTS = {
+    ('single', 'controller', None): (0, None),
+    ('single', 'dram', None): (1, None),
+    ('differential', 'controller', 'positive'): (0, 0),
+    ('differential', 'controller', 'negative'): (0, 1),
+    ('differential', 'dram', 'positive'): (1, 0),
+    ('differential', 'dram', 'negative'): (1, 1),
+}
 
-single_ended = defaultdict(lambda: ['', ''])
-differential = defaultdict(lambda:[['', ''], ['', '']])
+single_ended = {}
+differential = {}
 
 for port in info['ports']:
-    if port['net_type'] == 'single':
-        net_name = port['net']
-        
-        if port['component_role'] == 'controller':
-            single_ended[net_name][0] = port['sequence']
-        
-        elif port['component_role'] == 'dram':
-            single_ended[net_name][1] = port['sequence']
-
-    if port['net_type'] == 'differential':
-        pair_name = port['pair']
-        
-        if port['component_role'] == 'controller':
-            if port['polarity'] == 'positive':
-                differential[pair_name][0][0] = port['sequence']
-            elif port['polarity'] == 'negative':
-                differential[pair_name][0][1] = port['sequence']
-        
-        elif port['component_role'] == 'dram':
-            if port['polarity'] == 'positive':
-                differential[pair_name][1][0] = port['sequence']
-            elif port['polarity'] == 'negative':
-                differential[pair_name][1][1] = port['sequence']      
-        
-
-circuit = Circuit(version=info['solver_version'], non_graphical=True)  
-model = circuit.modeler.schematic.create_touchstone_component(snp_path)
-
-#%%
-for pin in model.pins:
-    circuit.modeler.schematic.create_interface_port(str(pin.pin_number), 
-                                                    location=pin.location)
-#%%
-expressions = {}
-for pair_name, (in_pair, out_pair) in differential.items():
-    
-    x, y = in_pair
-    circuit.set_differential_pair(str(x), str(y), differential_mode=f'Diff1_{pair_name}')
-    
-    x, y = out_pair
-    circuit.set_differential_pair(str(x), str(y), differential_mode=f'Diff2_{pair_name}')
-    
-    expressions[pair_name] = (f'dB(S(Diff1_{pair_name},Diff1_{pair_name}))',
-                              f'dB(S(Diff2_{pair_name},Diff1_{pair_name}))')
+    net_type = port['net_type']
+    polarity = port.get('polarity') if net_type == 'differential' else None
+    slot = PORT_SLOTS.get((net_type, port['component_role'], polarity))
+    if slot is None:
+        continue
 
-for net_name, (_in, _out) in single_ended.items():
-    expressions[net_name] = (f'dB(S({_in},{_in}))', f'dB(S({_out},{_in}))')
-    
+    side, position = slot
+    if position is None:
+        ends = single_ended.get(port['net'])
+        if ends is None:
+            ends = single_ended[port['net']] = ['', '']
+        ends[side] = port['sequence']
+    else:
+        ends = differential.get(port['pair'])
+        if ends is None:
+            ends = differential[port['pair']] = [['', ''], ['', '']]
+        ends[side][position] = port['sequence']
+
+
+# The curves are computed straight from the Touchstone S-matrix; AEDT's
+# Circuit would only re-derive the same numbers from this file. Circuit
+# interface ports are 50 ohm and its differential pairs use the standard
+# mixed-mode definition, which the formulas below reproduce.
 ntwk = rf.Network(snp_path)
-     
-setup = circuit.create_setup()
-setup.add_sweep_points(sweep_points=ntwk.frequency.f, units='Hz')
-setup.analyze()
+if not np.allclose(ntwk.z0, 50):
+    ntwk.renormalize(50)
+s = ntwk.s
+freq = ntwk.frequency.f
+
+
+def _port(sequence):
+    # Port sequence numbers are the 1-based Touchstone port order.
+    return int(sequence) - 1
+
+
+def _db(values):
+    # Clamp to a floor so zero magnitudes give a finite value instead of -inf,
+    # which would be written to the JSON as null.
+    return 20 * np.log10(np.maximum(np.abs(values), 1e-30))
+
+
+def _losses(return_loss, insertion_loss):
+    return {'return_loss': {'freq': freq, 'return loss': _db(return_loss)},
+            'insertion_loss': {'freq': freq, 'insetion loss': _db(insertion_loss)}
+            }
+
 
-#%%
 result = {}
-for name, (expression1, expression2) in expressions.items():
-    data = circuit.post.get_solution_data(expression1, context="Differential Pairs")
-    x1 = data.primary_sweep_values * 1e9
-    y1 = data.data_real()
-    
-    data = circuit.post.get_solution_data(expression2, context="Differential Pairs")
-    x2 = data.primary_sweep_values * 1e9
-    y2 = data.data_real()
-    
-    result[name] = {'return_loss': {'freq':list(x1), 'return loss':list(y1)},
-                    'insertion_loss': {'freq':list(x2), 'insetion loss':list(y2)}
-                    }
-circuit.release_desktop()
+for pair_name, (in_pair, out_pair) in differential.items():
+    p1, n1 = map(_port, in_pair)
+    p2, n2 = map(_port, out_pair)
+    sdd11 = 0.5 * (s[:, p1, p1] - s[:, p1, n1] - s[:, n1, p1] + s[:, n1, n1])
+    sdd21 = 0.5 * (s[:, p2, p1] - s[:, p2, n1] - s[:, n2, p1] + s[:, n2, n1])
+    result[pair_name] = _losses(sdd11, sdd21)
+
+for net_name, (_in, _out) in single_ended.items():
+    i, o = _port(_in), _port(_out)
+    result[net_name] = _losses(s[:, i, i], s[:, o, i])
 
 info['result'] = result
 
-with open(json_path, 'w') as f:
-    json.dump(info, f)
\ No newline at end of file
+with open(json_path, 'wb') as f:
+    f.write(dump_json(info))
@@ -77,7 +77,16 @@ def load_configuration(config_path):
     rx_diff_ports = _build_diff_list(rx_diff_map)
 
     cct_settings = data.get('cct_settings', {})
-    touchstone_path = data.get('touchstone_path')
+    # The file picked in the CCT tab is saved with the settings right before
+    # each run. Otherwise use the file run_sim.py exported for the current
+    # port count, and only then an older stored touchstone_path.
+    touchstone_path = cct_settings.get('touchstone_path')
+    if not touchstone_path and data.get('aedb_path') and ports:
+        candidate = os.path.join(os.path.dirname(data['aedb_path']), f'model.s{len(ports)}p')
+        if os.path.exists(candidate):
+            touchstone_path = candidate
+    if not touchstone_path:
+        touchstone_path = data.get('touchstone_path')
 
     if not touchstone_path:
         raise ValueError('Touchstone path is not defined in the project JSON.')
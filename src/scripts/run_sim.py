@@ -1,13 +1,21 @@
-import re, os
+import os
 import sys
-import json
-from pathlib import Path
+
+try:
+    import orjson
+
+    def load_json(f):
+        return orjson.loads(f.read())
+except ImportError:
+    import json
+
+    load_json = json.load
 
 #project_file = '../data2/project.json'
 project_file = sys.argv[1]
 
-with open(project_file) as f:
-    info = json.load(f)
+with open(project_file, 'rb') as f:
+    info = load_json(f)
     
 edb_path = info['aedb_path']
 from pyaedt import Hfss3dLayout
@@ -16,14 +24,11 @@ hfss = Hfss3dLayout(edb_path, version=info['solver_version'], non_graphical=True
 
 try:
     hfss.analyze()
+    # The export location is derived from aedb_path and the port count, so
+    # consumers recompute it instead of project.json being rewritten here.
     touchstone_path = os.path.join(os.path.dirname(info['aedb_path']), f'model.s{len(info["ports"])}p')
     hfss.export_touchstone('mysetup', 'mysweep', output_file=touchstone_path)
 
-    info["touchstone_path"] = touchstone_path
-    
-    with open(project_file, "w") as f:
-        json.dump(info, f, indent=3)
-
 except:
     raise
     
@@ -2,5 +2,7 @@
 
 from .app_state_store import AppStateStore
 from .external_script_runner import ExternalScriptRunner
+from .json_files import read_json, write_json
+from .log_file_writer import LogFileWriter
 
-__all__ = ["AppStateStore", "ExternalScriptRunner"]
+__all__ = ["AppStateStore", "ExternalScriptRunner", "LogFileWriter", "read_json", "write_json"]
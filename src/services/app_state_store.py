@@ -1,9 +1,10 @@
-import json
 import os
 import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .json_files import read_json, write_json
+
 
 def _default_base_dir(product_name: str) -> Path:
     if sys.platform.startswith("win"):
@@ -28,15 +29,13 @@ class AppStateStore:
     def load(self, app_name: str) -> Dict[str, Any]:
         path = self._state_file(app_name)
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                return json.load(fh)
+            return read_json(path)
         except FileNotFoundError:
             return {}
-        except json.JSONDecodeError:
+        except ValueError:
             return {}
 
     def save(self, app_name: str, data: Dict[str, Any]) -> None:
         path = self._state_file(app_name)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, ensure_ascii=False)
+        write_json(path, data, ensure_ascii=False)
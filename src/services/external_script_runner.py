@@ -1,4 +1,6 @@
+import json
 import subprocess
+import sys
 import uuid
 from collections import deque
 from dataclasses import dataclass, field
@@ -13,6 +15,36 @@ from PySide6.QtCore import (
     Signal,
 )
 
+# Marker used by ``scripts/aedt_worker.py`` for protocol lines on stdout.
+WORKER_EVENT_PREFIX = "@@aedt-worker@@ "
+
+_TRACEBACK_HEADER = "Traceback (most recent call last)"
+
+# stdout and stderr are read as one stream, so the log level of a line is
+# taken from how it starts (pyaedt tags its own lines, e.g. "PyAEDT ERROR:").
+# The lines of a traceback after its header are tracked per task, see
+# ``ExternalScriptRunner._emit_lines``.
+_LEVEL_PREFIXES = (
+    ("ERROR", "error"),
+    ("PyAEDT ERROR", "error"),
+    (_TRACEBACK_HEADER, "error"),
+    ("WARNING", "warning"),
+    ("PyAEDT WARNING", "warning"),
+    ("DEBUG", "debug"),
+    ("PyAEDT DEBUG", "debug"),
+)
+
+# Severity of each level, used to drop output below the runner's log level.
+LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+
+def _classify_line(line: str) -> str:
+    """Return the log level for one line of script output."""
+    for prefix, level in _LEVEL_PREFIXES:
+        if line.startswith(prefix):
+            return level
+    return "info"
+
 
 @dataclass
 class ExternalScriptTask:
@@ -23,12 +55,18 @@ class ExternalScriptTask:
     blocking: bool = False
     retries: int = 0
     attempts: int = 0
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Any = field(default_factory=dict)
     input_path: Optional[str] = None
     output_path: Optional[str] = None
     working_dir: Optional[str] = None
     description: Optional[str] = None
     env: Optional[Dict[str, str]] = None
+    steps: List[List[str]] = field(default_factory=list)
+    use_worker: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.steps:
+            self.steps = [self.command]
 
     def next_attempt(self) -> int:
         self.attempts += 1
@@ -44,6 +82,18 @@ class ExternalScriptRunner(QObject):
       - finished(task_id, exit_code, metadata)
       - error(task_id, exit_code, message, metadata)
       - log_message(task_id, level, message, metadata)
+
+    Script output is emitted once per run of consecutive lines with the same
+    level, so ``message`` may hold several lines separated by ``\n``.
+
+    When ``worker_script`` is given, Python script tasks submitted with
+    ``use_worker=True`` are executed by one long-lived worker interpreter
+    instead of a new process per task, so heavy imports are paid only once.
+    Modules, singletons and open handles persist between those scripts, so
+    only opt in for scripts that keep no state across runs. Other commands,
+    and every task when the worker cannot be started, get their own process.
+    Cancelling a worker task kills the worker; the next worker task starts a
+    new one.
     """
 
     started = Signal(str, int, object)
@@ -51,32 +101,60 @@ class ExternalScriptRunner(QObject):
     error = Signal(str, int, str, object)
     log_message = Signal(str, str, str, object)
 
-    def __init__(self, max_concurrent: int = 1, parent: Optional[QObject] = None):
+    def __init__(
+        self,
+        max_concurrent: int = 1,
+        parent: Optional[QObject] = None,
+        worker_script: Optional[str] = None,
+    ):
         super().__init__(parent)
         self.max_concurrent = max(1, max_concurrent)
         self._queue: deque[ExternalScriptTask] = deque()
         self._active: Dict[str, Dict[str, Any]] = {}
+        self.worker_script = worker_script
+        self.use_worker = worker_script is not None
+        self._worker: Optional[QProcess] = None
+        self._worker_task_id: Optional[str] = None
+        self._worker_buffer = bytearray()
+        self._min_level = LOG_LEVELS["info"]
+
+        # Built once and shared by every process we start. Unbuffered UTF-8
+        # output lets lines reach the log as they are printed and matches
+        # how the output is decoded.
+        self._process_env = QProcessEnvironment.systemEnvironment()
+        self._process_env.insert("PYTHONUNBUFFERED", "1")
+        self._process_env.insert("PYTHONIOENCODING", "utf-8")
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
+    def set_log_level(self, level: str) -> None:
+        """Stop emitting script output below ``level`` ("debug", "info", "warning" or "error")."""
+        try:
+            self._min_level = LOG_LEVELS[level.lower()]
+        except (AttributeError, KeyError):
+            raise ValueError(f"Unknown log level: {level!r}") from None
+
     def run_task(
         self,
         command: Iterable[str],
         *,
         blocking: bool = False,
         retries: int = 0,
-        metadata: Optional[Dict[str, Any]] = None,
+        metadata: Any = None,
         input_path: Optional[str] = None,
         output_path: Optional[str] = None,
         working_dir: Optional[str] = None,
         description: Optional[str] = None,
         env: Optional[Dict[str, str]] = None,
+        use_worker: bool = False,
     ) -> Tuple[str, Optional[int]]:
         """
         Schedule a command for execution.
 
-        Returns (task_id, exit_code). For asynchronous tasks exit_code is None.
+        ``use_worker`` lets an asynchronous Python script run in the shared
+        worker interpreter. Returns (task_id, exit_code). For asynchronous
+        tasks exit_code is None.
         """
         task = ExternalScriptTask(
             task_id=str(uuid.uuid4()),
@@ -89,6 +167,7 @@ class ExternalScriptRunner(QObject):
             working_dir=working_dir,
             description=description,
             env=env,
+            use_worker=use_worker,
         )
 
         if blocking:
@@ -99,8 +178,54 @@ class ExternalScriptRunner(QObject):
         QTimer.singleShot(0, self._try_start_next)
         return task.task_id, None
 
+    def run_chain(
+        self,
+        commands: Iterable[Iterable[str]],
+        *,
+        retries: int = 0,
+        metadata: Any = None,
+        input_path: Optional[str] = None,
+        output_path: Optional[str] = None,
+        working_dir: Optional[str] = None,
+        description: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        use_worker: bool = False,
+    ) -> str:
+        """
+        Schedule several commands that run back to back as one task.
+
+        The next command only starts once the previous one exited with code 0;
+        the first failure ends the chain. ``started`` and ``finished``/``error``
+        are emitted once for the whole chain, and a retry restarts it from the
+        first command. ``use_worker`` works as for :meth:`run_task`. Returns
+        the task_id.
+        """
+        steps = [list(command) for command in commands]
+        if not steps:
+            raise ValueError("run_chain() needs at least one command.")
+        task = ExternalScriptTask(
+            task_id=str(uuid.uuid4()),
+            command=steps[0],
+            retries=retries,
+            metadata=metadata or {},
+            input_path=input_path,
+            output_path=output_path,
+            working_dir=working_dir,
+            description=description,
+            env=env,
+            steps=steps,
+            use_worker=use_worker,
+        )
+        self._queue.append(task)
+        QTimer.singleShot(0, self._try_start_next)
+        return task.task_id
+
     def cancel_task(self, task_id: str) -> bool:
-        """Cancel a queued or running task."""
+        """Cancel a queued or running task.
+
+        A task running in the worker is stopped by killing the worker, which
+        ends the rest of that task's chain as well.
+        """
         # Cancel queued task
         for task in list(self._queue):
             if task.task_id == task_id:
@@ -127,6 +252,19 @@ class ExternalScriptRunner(QObject):
         for task_id in list(self._active.keys()):
             self.cancel_task(task_id)
 
+    def shutdown(self) -> None:
+        """Stop the persistent worker process, if one is running."""
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        worker.blockSignals(True)
+        if self._worker_task_id is None:
+            worker.closeWriteChannel()
+            if worker.waitForFinished(1000):
+                return
+        worker.kill()
+        worker.waitForFinished(1000)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -137,24 +275,20 @@ class ExternalScriptRunner(QObject):
 
     def _start_async_task(self, task: ExternalScriptTask) -> None:
         attempt = task.next_attempt()
-        process = QProcess(self)
-        if task.working_dir:
-            process.setWorkingDirectory(task.working_dir)
-        if task.env:
-            env = QProcessEnvironment.systemEnvironment()
-            for key, value in task.env.items():
-                env.insert(key, value)
-            process.setProcessEnvironment(env)
-
-        self._active[task.task_id] = {
-            "process": process,
+        worker = self._worker_for(task)
+        record = {
+            "process": worker,
             "task": task,
+            "step": 0,
             "cancelled": False,
+            "output_buffer": bytearray(),
+            "in_traceback": False,
         }
+        self._active[task.task_id] = record
 
         self.started.emit(task.task_id, attempt, task.metadata)
         if task.description:
-            self.log_message.emit(
+            self._emit_output(
                 task.task_id,
                 "info",
                 f"{task.description} (attempt {attempt})",
@@ -162,32 +296,172 @@ class ExternalScriptRunner(QObject):
             )
 
         if task.input_path:
-            self.log_message.emit(
+            self._emit_output(
                 task.task_id,
                 "debug",
                 f"Input: {task.input_path}",
                 task.metadata,
             )
         if task.output_path:
-            self.log_message.emit(
+            self._emit_output(
                 task.task_id,
                 "debug",
                 f"Output: {task.output_path}",
                 task.metadata,
             )
 
-        process.readyReadStandardOutput.connect(partial(self._handle_stdout, task.task_id))
-        process.readyReadStandardError.connect(partial(self._handle_stderr, task.task_id))
+        if worker is not None:
+            # The worker runs the whole chain and reports it once.
+            record["step"] = len(task.steps) - 1
+            self._worker_task_id = task.task_id
+            if worker.state() == QProcess.Running:
+                self._submit_to_worker(task)
+            # Otherwise _handle_worker_started sends it once the worker is up.
+        else:
+            self._spawn_step(task, record)
+
+    def _spawn_step(self, task: ExternalScriptTask, record: Dict[str, Any]) -> None:
+        """Start the current step of ``task`` in a process of its own."""
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.MergedChannels)
+        process.setStandardInputFile(QProcess.nullDevice())
+        if task.working_dir:
+            process.setWorkingDirectory(task.working_dir)
+        if task.env:
+            env = QProcessEnvironment(self._process_env)
+            for key, value in task.env.items():
+                env.insert(key, value)
+            process.setProcessEnvironment(env)
+        else:
+            process.setProcessEnvironment(self._process_env)
+        record["process"] = process
+
+        process.readyReadStandardOutput.connect(partial(self._handle_merged, task.task_id))
         process.errorOccurred.connect(partial(self._handle_process_error, task.task_id))
         process.finished.connect(partial(self._handle_finished, task.task_id))
 
-        process.start(task.command[0], task.command[1:])
+        command = task.steps[record["step"]]
+        process.start(command[0], command[1:])
+
+    # ------------------------------------------------------------------
+    # Persistent worker
+    # ------------------------------------------------------------------
+    def _worker_for(self, task: ExternalScriptTask) -> Optional[QProcess]:
+        """Return the worker process if ``task`` opted in and is a Python script it can run now.
+
+        The worker runs one task at a time; while it is busy, further tasks
+        (with ``max_concurrent > 1``) get a process of their own.
+        """
+        if not (self.use_worker and task.use_worker) or self._worker_task_id is not None:
+            return None
+        for command in task.steps:
+            if len(command) < 2 or command[0] != sys.executable or not command[1].endswith(".py"):
+                return None
+        if self._worker is None:
+            self._start_worker()
+        return self._worker
+
+    def _start_worker(self) -> None:
+        """Start the worker without waiting for it; failures arrive through ``errorOccurred``."""
+        worker = QProcess(self)
+        worker.setProcessChannelMode(QProcess.MergedChannels)
+        worker.setProcessEnvironment(self._process_env)
+        worker.readyReadStandardOutput.connect(self._handle_worker_output)
+        worker.started.connect(self._handle_worker_started)
+        worker.errorOccurred.connect(self._handle_worker_error)
+        worker.finished.connect(self._handle_worker_exit)
+        self._worker_buffer.clear()
+        self._worker = worker
+        # May report FailedToStart synchronously, which clears self._worker.
+        worker.start(sys.executable, ["-u", self.worker_script])
+
+    def _handle_worker_started(self) -> None:
+        record = self._active.get(self._worker_task_id or "")
+        if record is not None:
+            self._submit_to_worker(record["task"])
+
+    def _handle_worker_error(self, error: QProcess.ProcessError) -> None:
+        if error != QProcess.FailedToStart:
+            return  # crashes are reported through finished
+        # Fall back to one process per task for the rest of the session.
+        self.use_worker = False
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.blockSignals(True)
+            worker.deleteLater()
+
+        task_id, self._worker_task_id = self._worker_task_id, None
+        record = self._active.get(task_id or "")
+        if record is None:
+            return
+        if record["cancelled"]:
+            self._handle_finished(task_id, -1, QProcess.NormalExit)
+            return
+        record["step"] = 0
+        self._spawn_step(record["task"], record)
+
+    def _submit_to_worker(self, task: ExternalScriptTask) -> None:
+        self._worker_task_id = task.task_id
+        request = {
+            "task_id": task.task_id,
+            "steps": [{"script": command[1], "args": command[2:]} for command in task.steps],
+            "cwd": task.working_dir,
+            "env": dict(task.env) if task.env else None,
+        }
+        self._worker.write((json.dumps(request) + "\n").encode("utf-8"))
+
+    def _handle_worker_output(self) -> None:
+        if self._worker is None:
+            return
+        chunk = self._worker.readAllStandardOutput()
+        if chunk.isEmpty():
+            return
+        lines: List[str] = []
+        for line in self._split_lines(self._worker_buffer, chunk):
+            if line.startswith(WORKER_EVENT_PREFIX):
+                # Output printed before the event belongs to the finishing task.
+                self._emit_worker_lines(lines)
+                lines = []
+                self._handle_worker_event(line[len(WORKER_EVENT_PREFIX):])
+            else:
+                lines.append(line)
+        self._emit_worker_lines(lines)
+
+    def _emit_worker_lines(self, lines: List[str]) -> None:
+        record = self._active.get(self._worker_task_id or "")
+        if lines and record:
+            self._emit_lines(self._worker_task_id, lines, record)
+
+    def _handle_worker_event(self, raw: str) -> None:
+        try:
+            event = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        task_id = self._worker_task_id
+        if event.get("event") != "done" or not task_id or event.get("task_id") != task_id:
+            return
+        self._worker_task_id = None
+        self._handle_finished(task_id, int(event.get("exit_code", 1)), QProcess.NormalExit)
+
+    def _handle_worker_exit(self, exit_code: int, status: QProcess.ExitStatus) -> None:
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.deleteLater()
+        if self._worker_buffer:
+            self._emit_worker_lines([bytes(self._worker_buffer).decode("utf-8", "replace").rstrip("\r")])
+            self._worker_buffer.clear()
+
+        task_id, self._worker_task_id = self._worker_task_id, None
+        if task_id:
+            if status == QProcess.CrashExit or exit_code == 0:
+                exit_code = -1
+            self._handle_finished(task_id, exit_code, status)
 
     def _run_blocking_task(self, task: ExternalScriptTask) -> int:
         attempt = task.next_attempt()
         self.started.emit(task.task_id, attempt, task.metadata)
         if task.description:
-            self.log_message.emit(
+            self._emit_output(
                 task.task_id,
                 "info",
                 f"{task.description} (blocking attempt {attempt})",
@@ -204,10 +478,10 @@ class ExternalScriptRunner(QObject):
             )
             if result.stdout:
                 for line in result.stdout.splitlines():
-                    self.log_message.emit(task.task_id, "info", line, task.metadata)
+                    self._emit_output(task.task_id, "info", line, task.metadata)
             if result.stderr:
                 for line in result.stderr.splitlines():
-                    self.log_message.emit(task.task_id, "error", line, task.metadata)
+                    self._emit_output(task.task_id, "error", line, task.metadata)
 
             if result.returncode == 0:
                 self.finished.emit(task.task_id, result.returncode, task.metadata)
@@ -224,7 +498,7 @@ class ExternalScriptRunner(QObject):
 
     def _emit_or_retry_blocking_failure(self, task: ExternalScriptTask, exit_code: int) -> None:
         if task.attempts <= task.retries:
-            self.log_message.emit(
+            self._emit_output(
                 task.task_id,
                 "warning",
                 f"Command failed with exit code {exit_code}. Retrying (attempt {task.attempts + 1}).",
@@ -239,29 +513,83 @@ class ExternalScriptRunner(QObject):
             task.metadata,
         )
 
-    def _handle_stdout(self, task_id: str) -> None:
+    def _handle_merged(self, task_id: str) -> None:
         record = self._active.get(task_id)
         if not record:
             return
-        process: QProcess = record["process"]
-        data = process.readAllStandardOutput().data().decode(errors="ignore")
-        if not data:
-            return
-        for line in data.splitlines():
-            if line:
-                self.log_message.emit(task_id, "info", line, record["task"].metadata)
-
-    def _handle_stderr(self, task_id: str) -> None:
-        record = self._active.get(task_id)
-        if not record:
-            return
-        process: QProcess = record["process"]
-        data = process.readAllStandardError().data().decode(errors="ignore")
-        if not data:
+        chunk = record["process"].readAllStandardOutput()
+        if chunk.isEmpty():
+            return  # spurious readyRead
+        self._emit_lines(task_id, self._split_lines(record["output_buffer"], chunk), record)
+
+    def _emit_output(self, task_id: str, level: str, line: str, metadata: Any) -> None:
+        """Emit one line of script output unless it is below the log level."""
+        if LOG_LEVELS[level] >= self._min_level:
+            self.log_message.emit(task_id, level, line, metadata)
+
+    def _emit_lines(self, task_id: str, lines: List[str], record: Dict[str, Any]) -> None:
+        """Emit script output lines, one signal per run of lines with the same level.
+
+        A traceback is an error from its header up to and including the
+        exception line, the first unindented line after the frames; whether
+        the task is inside one is kept in ``record`` across chunks. Empty
+        lines and lines below the log level are dropped.
+        """
+        metadata = record["task"].metadata
+        min_level = self._min_level
+        in_traceback = record["in_traceback"]
+        run_level = None
+        run: List[str] = []
+        for line in lines:
+            if not line:
+                continue
+            if in_traceback:
+                level = "error"
+                in_traceback = line[0] in " \t"
+            else:
+                level = _classify_line(line)
+                in_traceback = line.startswith(_TRACEBACK_HEADER)
+            if LOG_LEVELS[level] < min_level:
+                continue
+            if level != run_level and run:
+                self.log_message.emit(task_id, run_level, "\n".join(run), metadata)
+                run = []
+            run_level = level
+            run.append(line)
+        if run:
+            self.log_message.emit(task_id, run_level, "\n".join(run), metadata)
+        record["in_traceback"] = in_traceback
+
+    @staticmethod
+    def _split_lines(buf: bytearray, chunk: Any) -> List[str]:
+        """Append ``chunk`` to ``buf`` and return every complete line.
+
+        Bytes are only decoded once a full line is available, so a multi-byte
+        character or a line split across two ``readyRead`` signals is never
+        mangled. The trailing partial line stays buffered for the next chunk.
+        """
+        buf += bytes(chunk)
+        # Walk the buffer by index and trim the consumed prefix once, so a
+        # large chunk is not shifted left again after every line.
+        lines = []
+        start = 0
+        with memoryview(buf) as view:
+            idx = buf.find(b"\n")
+            while idx != -1:
+                lines.append(str(view[start:idx], "utf-8", "replace").rstrip("\r"))
+                start = idx + 1
+                idx = buf.find(b"\n", start)
+        del buf[:start]
+        return lines
+
+    def _flush_streams(self, task_id: str, record: Dict[str, Any]) -> None:
+        """Emit any unterminated output left in the buffer of a finished task."""
+        buf: bytearray = record["output_buffer"]
+        if not buf:
             return
-        for line in data.splitlines():
-            if line:
-                self.log_message.emit(task_id, "error", line, record["task"].metadata)
+        line = bytes(buf).decode("utf-8", "replace").rstrip("\r")
+        buf.clear()
+        self._emit_lines(task_id, [line], record)
 
     def _handle_process_error(self, task_id: str, error: QProcess.ProcessError) -> None:
         record = self._active.get(task_id)
@@ -276,6 +604,7 @@ class ExternalScriptRunner(QObject):
         if not record:
             return
 
+        self._flush_streams(task_id, record)
         cancelled = record.get("cancelled", False)
         task: ExternalScriptTask = record["task"]
 
@@ -284,13 +613,20 @@ class ExternalScriptRunner(QObject):
             self._try_start_next()
             return
 
+        if exit_code == 0 and record["step"] + 1 < len(task.steps):
+            # Linked chain: move straight on to the next command.
+            record["step"] += 1
+            self._active[task_id] = record
+            self._spawn_step(task, record)
+            return
+
         if exit_code == 0:
             self.finished.emit(task_id, exit_code, task.metadata)
             self._try_start_next()
             return
 
         if task.attempts <= task.retries:
-            self.log_message.emit(
+            self._emit_output(
                 task_id,
                 "warning",
                 f"Command exited with code {exit_code}. Retrying (attempt {task.attempts + 1}).",
@@ -314,6 +650,7 @@ class ExternalScriptRunner(QObject):
         is_error: bool,
     ) -> None:
         self._active.pop(task_id, None)
+        self._flush_streams(task_id, record)
         task: ExternalScriptTask = record["task"]
         if is_error:
             self.error.emit(task_id, exit_code, message, task.metadata)
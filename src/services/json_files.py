@@ -0,0 +1,60 @@
+"""Small helpers for reading and writing the JSON files the GUI saves."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+
+    def _loads(raw: bytes) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity written by json.dumps, or a UTF-8 BOM.
+            return json.loads(raw)
+except ImportError:
+    _loads = json.loads
+
+# Absolute path -> (st_mtime_ns, st_size, raw file contents).
+_read_cache: Dict[str, Tuple[int, int, bytes]] = {}
+
+
+def read_json(path: Any) -> Any:
+    """Return the parsed contents of ``path``, reading the file only when it changed.
+
+    The file is re-read when its modification time or size differs from the
+    last read or :func:`write_json`, so edits made by the external scripts
+    are still picked up. The cached bytes are parsed on every call, so each
+    caller gets its own objects and may modify them freely.
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    cached = _read_cache.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        raw = cached[2]
+    else:
+        with open(key, "rb") as handle:
+            stat = os.fstat(handle.fileno())
+            raw = handle.read()
+        _read_cache[key] = (stat.st_mtime_ns, stat.st_size, raw)
+    return _loads(raw)
+
+
+def write_json(path: Any, data: Any, *, indent: int = 2, ensure_ascii: bool = True) -> None:
+    """Serialize ``data`` in memory and write it to ``path`` with a single ``write``.
+
+    ``json.dump`` writes to the file once per token; for project files that
+    is hundreds of small writes, which is slow on network drives. The written
+    bytes are remembered so the next :func:`read_json` of ``path`` skips the
+    disk read.
+    """
+    raw = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii).encode("utf-8")
+    key = os.path.abspath(path)
+    with open(key, "wb") as handle:
+        handle.write(raw)
+        handle.flush()
+        stat = os.fstat(handle.fileno())
+    _read_cache[key] = (stat.st_mtime_ns, stat.st_size, raw)
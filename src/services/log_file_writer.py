@@ -0,0 +1,100 @@
+"""Background writer for project log files."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+# Queue item that asks the writer thread to close its file handles.
+_CLOSE = (None, None)
+
+
+class LogFileWriter:
+    """
+    Append log text to files from a daemon thread.
+
+    The GUI thread only enqueues text, so a slow or remote log disk never
+    blocks the event loop. Everything queued since the last wake-up is
+    written with one ``write`` per file followed by one ``flush``.
+
+    ``on_error(message)`` is called from the writer thread when a file
+    cannot be written; pass a Qt signal's ``emit`` to get it back onto the
+    GUI thread.
+    """
+
+    def __init__(self, on_error: Optional[Callable[[str], None]] = None, max_pending: int = 10000):
+        self._on_error = on_error
+        self._queue: queue.Queue[Tuple[Optional[str], Optional[str]]] = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, path: str, text: str) -> bool:
+        """Queue ``text`` for ``path``. Returns False if the queue is full and the text was dropped."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((path, text))
+        except queue.Full:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Write everything queued so far and close the open file handle."""
+        if self._thread is None:
+            return
+        self._queue.put(_CLOSE)
+        self._queue.join()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-file-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        handles: Dict[str, TextIO] = {}
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch, handles)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[Optional[str], Optional[str]]], handles: Dict[str, TextIO]) -> None:
+        # Join consecutive texts for the same file so each file gets one write.
+        runs: List[Tuple[Optional[str], List[str]]] = []
+        for path, text in batch:
+            if runs and runs[-1][0] == path and path is not None:
+                runs[-1][1].append(text)
+            else:
+                runs.append((path, [text] if text is not None else []))
+
+        for path, texts in runs:
+            if path is None:
+                self._close_handles(handles)
+                continue
+            try:
+                handle = handles.get(path)
+                if handle is None:
+                    # Only the current project's log is kept open.
+                    self._close_handles(handles)
+                    handle = handles[path] = open(path, "a", encoding="utf-8")
+                handle.write("".join(texts))
+                handle.flush()
+            except OSError as exc:
+                self._close_handles({path: handles.pop(path)} if path in handles else {})
+                if self._on_error:
+                    self._on_error(f"CRITICAL: Could not write to log file {path}. Error: {exc}")
+
+    @staticmethod
+    def _close_handles(handles: Dict[str, TextIO]) -> None:
+        for handle in handles.values():
+            try:
+                handle.close()
+            except OSError:
+                pass
+        handles.clear()
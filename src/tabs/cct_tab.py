@@ -1,6 +1,5 @@
 import json
 import os
-import sys
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -19,6 +18,8 @@ from PySide6.QtWidgets import (
     QHeaderView,
 )
 
+from src.services import read_json, write_json
+
 from .base import BaseTab
 
 
@@ -120,9 +121,8 @@ class CctTab(BaseTab):
         buttons_layout = QHBoxLayout()
         buttons_layout.addStretch()
         self.apply_button = QPushButton("Apply")
-        primary_style = "background-color: #007bff; color: white; border: none;"
-        self.apply_button.setStyleSheet(primary_style)
-        self.apply_button_original_style = primary_style
+        self.apply_button.setObjectName("primaryButton")
+        self.apply_button_original_style = ""
         buttons_layout.addWidget(self.apply_button)
         layout.addLayout(buttons_layout)
 
@@ -253,8 +253,7 @@ class CctTab(BaseTab):
             return
 
         try:
-            with open(project_path, "r", encoding="utf-8") as handle:
-                project_data = json.load(handle)
+            project_data = read_json(project_path)
         except (OSError, json.JSONDecodeError) as exc:
             controller.log(f"Could not read project file: {exc}", "red")
             return
@@ -282,12 +281,13 @@ class CctTab(BaseTab):
             controller.log(f"Touchstone file not found: {touchstone_path}", "red")
             return
 
-        project_data["touchstone_path"] = os.path.normpath(touchstone_path)
+        # Kept with the CCT settings: a top-level touchstone_path would go
+        # stale once the simulation is re-run with a different port count.
+        settings["touchstone_path"] = os.path.normpath(touchstone_path)
         project_data["cct_settings"] = settings
 
         try:
-            with open(project_path, "w", encoding="utf-8") as handle:
-                json.dump(project_data, handle, indent=2)
+            write_json(project_path, project_data)
         except OSError as exc:
             controller.log(f"Could not write project file: {exc}", "red")
             return
@@ -300,28 +300,15 @@ class CctTab(BaseTab):
 
     def _start_cct_process(self, project_path):
         controller = self.controller
-        action_spec = controller.get_action_spec("run_cct", tab_name="cct_tab")
-        script_path = action_spec["script"]
-        command = [sys.executable, script_path, project_path]
-        if action_spec.get("args"):
-            command.extend(action_spec["args"])
-
-        metadata = {
-            "type": "run_cct",
-            "description": "Running CCT calculation",
-            "button": self.apply_button,
-            "button_style": getattr(self, "apply_button_original_style", ""),
-            "button_reset_text": "Apply",
-        }
-
         controller.set_button_running(self.apply_button)
-        task_id = controller.submit_task(
-            command,
-            metadata=metadata,
+        task_id = controller.run_script(
+            "run_cct",
+            project_path,
+            tab_name="cct_tab",
+            description="Running CCT calculation",
+            button=self.apply_button,
+            button_style=getattr(self, "apply_button_original_style", ""),
             input_path=project_path,
-            description=metadata["description"],
-            working_dir=action_spec.get("working_dir"),
-            env=action_spec.get("env"),
         )
 
         if task_id is None:
@@ -339,8 +326,7 @@ class CctTab(BaseTab):
             return
 
         try:
-            with open(project_path, "r", encoding="utf-8") as handle:
-                project_data = json.load(handle)
+            project_data = read_json(project_path)
         except (OSError, json.JSONDecodeError) as exc:
             self.controller.log(f"Could not load project data: {exc}", "red")
             return
@@ -348,10 +334,26 @@ class CctTab(BaseTab):
         self.project_path_input.setText(project_path)
         self.controller.project_file = project_path
 
-        touchstone_path = project_data.get("touchstone_path") or ""
+        # Prefer the latest run_sim.py export for the current port count,
+        # then the file last used for CCT, then an older stored path.
+        cct_settings = project_data.get("cct_settings") or {}
+        touchstone_path = ""
+        if project_data.get("aedb_path") and project_data.get("ports"):
+            candidate = os.path.join(
+                os.path.dirname(project_data["aedb_path"]),
+                f"model.s{len(project_data['ports'])}p",
+            )
+            if os.path.exists(candidate):
+                touchstone_path = candidate
+        touchstone_path = (
+            touchstone_path
+            or cct_settings.get("touchstone_path")
+            or project_data.get("touchstone_path")
+            or ""
+        )
         self.touchstone_path_input.setText(touchstone_path)
 
-        self._apply_settings_to_inputs(project_data.get("cct_settings") or {})
+        self._apply_settings_to_inputs(cct_settings)
         ports = project_data.get("ports") or []
         ports_ready = bool(project_data.get("cct_ports_ready"))
         self._update_port_information(ports_ready, ports)
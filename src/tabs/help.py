@@ -4,6 +4,21 @@ import os
 from PySide6.QtWidgets import QTextBrowser, QVBoxLayout, QWidget
 import markdown
 
+# markdown path -> (mtime, rendered HTML), shared by every HelpTab instance.
+_rendered_cache = {}
+
+
+def render_markdown_file(markdown_path):
+    """Return the HTML for ``markdown_path``, re-rendering only when the file changed."""
+    mtime = os.stat(markdown_path).st_mtime
+    cached = _rendered_cache.get(markdown_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(markdown_path, "r", encoding="utf-8") as handle:
+        html = markdown.markdown(handle.read())
+    _rendered_cache[markdown_path] = (mtime, html)
+    return html
+
 
 class HelpTab(QWidget):
     """A widget that renders and displays a Markdown help file."""
@@ -22,14 +37,9 @@ class HelpTab(QWidget):
 
     def load_help_content(self, markdown_path):
         """Load and render the content of a given Markdown file."""
-        if not os.path.exists(markdown_path):
-            self.text_browser.setHtml("<h1>Help file not found</h1>")
-            return
-
         try:
-            with open(markdown_path, "r", encoding="utf-8") as handle:
-                markdown_text = handle.read()
-            html = markdown.markdown(markdown_text)
-            self.text_browser.setHtml(html)
+            self.text_browser.setHtml(render_markdown_file(markdown_path))
+        except FileNotFoundError:
+            self.text_browser.setHtml("<h1>Help file not found</h1>")
         except Exception as exc:
             self.text_browser.setHtml(f"<h1>Error loading help file</h1><p>{exc}</p>")
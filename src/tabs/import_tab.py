@@ -1,7 +1,5 @@
 import os
 import shutil
-import sys
-import json
 from datetime import datetime
 
 from PySide6.QtWidgets import (
@@ -18,6 +16,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
+from src.services import write_json
+
 from .base import BaseTab
 
 
@@ -61,10 +61,9 @@ class ImportTab(BaseTab):
         # --- Apply Import Button ---
         import_button_layout = QHBoxLayout()
         import_button_layout.addStretch()
-        primary_style = "background-color: #007bff; color: white; border: none;"
         self.apply_import_button = QPushButton("Apply")
-        self.apply_import_button.setStyleSheet(primary_style)
-        self.apply_import_button_original_style = primary_style
+        self.apply_import_button.setObjectName("primaryButton")
+        self.apply_import_button_original_style = ""
         import_button_layout.addWidget(self.apply_import_button)
         main_layout.addLayout(import_button_layout)
 
@@ -94,8 +93,8 @@ class ImportTab(BaseTab):
         stackup_button_layout = QHBoxLayout()
         stackup_button_layout.addStretch()
         self.apply_stackup_button = QPushButton("Apply")
-        self.apply_stackup_button.setStyleSheet(primary_style)
-        self.apply_stackup_button_original_style = primary_style
+        self.apply_stackup_button.setObjectName("primaryButton")
+        self.apply_stackup_button_original_style = ""
         stackup_button_layout.addWidget(self.apply_stackup_button)
         main_layout.addLayout(stackup_button_layout)
 
@@ -171,21 +170,15 @@ class ImportTab(BaseTab):
         controller.log(f"Applying new stackup: {new_stackup_path}")
         controller.set_button_running(self.apply_stackup_button)
 
-        action_spec = controller.get_action_spec("modify_xml", tab_name="import_tab")
-        script_path = action_spec["script"]
-        python_executable = sys.executable
-
-        command = [python_executable, script_path, controller.project_file, new_stackup_path]
-        
-        metadata = {
-            "type": "modify_xml",
-            "description": "Modifying stackup XML",
-            "button": self.apply_stackup_button,
-            "button_style": self.apply_stackup_button_original_style,
-            "button_reset_text": "Apply",
-        }
-
-        controller.submit_task(command, metadata=metadata)
+        controller.run_script(
+            "modify_xml",
+            controller.project_file,
+            new_stackup_path,
+            tab_name="import_tab",
+            description="Modifying stackup XML",
+            button=self.apply_stackup_button,
+            button_style=self.apply_stackup_button_original_style,
+        )
 
     def run_get_edb(self):
         controller = self.controller
@@ -233,8 +226,7 @@ class ImportTab(BaseTab):
                 "stackup_path": stackup_path,
                 "app_name": controller.app_name,
             }
-            with open(controller.project_file, "w") as f:
-                json.dump(project_data, f, indent=4)
+            write_json(controller.project_file, project_data, indent=4)
             controller.log(f"Initial project file created: {controller.project_file}")
             controller.update_state(
                 project_file=controller.project_file,
@@ -254,24 +246,13 @@ class ImportTab(BaseTab):
         controller.set_button_running(self.apply_import_button)
         controller.current_layout_path = layout_path
 
-        action_spec = controller.get_action_spec("get_edb", tab_name="import_tab")
-        script_path = action_spec["script"]
-        python_executable = sys.executable
-
-        command = [python_executable, script_path, controller.project_file]
-        
-        metadata = {
-            "type": "get_edb",
-            "description": "Importing layout into EDB",
-            "button": self.apply_import_button,
-            "button_style": self.apply_import_button_original_style,
-            "button_reset_text": "Apply",
-        }
-
-        controller.submit_task(
-            command,
-            metadata=metadata,
+        controller.run_script(
+            "get_edb",
+            controller.project_file,
+            tab_name="import_tab",
+            description="Importing layout into EDB",
+            button=self.apply_import_button,
+            button_style=self.apply_import_button_original_style,
             input_path=controller.project_file,
             output_path=controller.project_file,
-            description=metadata["description"],
         )
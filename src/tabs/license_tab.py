@@ -49,7 +49,7 @@ class LicenseTab(QWidget):
         # Check license button
         button_layout = QHBoxLayout()
         self.check_license_button = QPushButton("Check License Status")
-        self.check_license_button.setStyleSheet("background-color: #007bff; color: white; border: none;")
+        self.check_license_button.setObjectName("primaryButton")
         self.check_license_button.clicked.connect(self.check_license_status)
         button_layout.addStretch()
         button_layout.addWidget(self.check_license_button)
@@ -1,7 +1,6 @@
-import json
 import os
 import re
-import sys
+from collections import Counter
 
 from PySide6.QtWidgets import (
     QVBoxLayout,
@@ -12,18 +11,100 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QListWidget,
     QGroupBox,
-    QListWidgetItem,
 )
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QAbstractItemView
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+from PySide6.QtWidgets import QAbstractItemView, QListView
+
+from src.services import read_json, write_json
 
 from .base import BaseTab
 
+# Controller/DRAM selections whose net lists are kept for reuse.
+_SELECTION_CACHE_SIZE = 32
+
+
+class NetListModel(QAbstractListModel):
+    """Checkable net names backed by a plain list and one check flag per row.
+
+    Replacing the nets is a single model reset instead of one row insert
+    (and one view update) per item.
+    """
+
+    _FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._checks = bytearray()
+        # Number of checked rows, kept in step with _checks so the label
+        # update after each toggle does not rescan the list.
+        self._checked = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._names[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checks[row] else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        row = index.row()
+        checked = Qt.CheckState(value) == Qt.Checked
+        self._checked += checked - self._checks[row]
+        self._checks[row] = checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        return self._FLAGS if index.isValid() else Qt.NoItemFlags
+
+    def set_names(self, names):
+        """Replace all nets; every net starts unchecked."""
+        self.beginResetModel()
+        self._names = list(names)
+        self._checks = bytearray(len(self._names))
+        self._checked = 0
+        self.endResetModel()
+
+    def set_checked(self, rows, checked):
+        """Check or uncheck ``rows`` with one ``dataChanged`` notification."""
+        rows = list(rows)
+        if not rows:
+            return
+        checks = self._checks
+        for row in rows:
+            self._checked += checked - checks[row]
+            checks[row] = checked
+        self.dataChanged.emit(
+            self.index(min(rows)), self.index(max(rows)), [Qt.CheckStateRole]
+        )
+
+    def is_checked(self, row):
+        return bool(self._checks[row])
+
+    def checked_count(self):
+        return self._checked
+
+    def checked_names(self):
+        return [name for name, checked in zip(self._names, self._checks) if checked]
+
+
+class NetListView(QListView):
+    """List of checkable nets; Space toggles every selected net at once."""
 
-class NetListWidget(QListWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setUniformItemSizes(True)
+        self.setModel(NetListModel(self))
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Space:
@@ -32,23 +113,58 @@ class NetListWidget(QListWidget):
             super().keyPressEvent(event)
 
     def toggle_selected_items_check_state(self):
-        selected_items = self.selectedItems()
-        if not selected_items:
+        # Like QListWidget.selectedItems(), the first selected row (in
+        # selection order) decides whether the rows get checked or unchecked.
+        rows = [index.row() for index in self.selectionModel().selectedRows()]
+        if not rows:
             return
+        model = self.model()
+        model.set_checked(rows, not model.is_checked(rows[0]))
+
+    def set_nets(self, names):
+        self.model().set_names(names)
+
+    def checked_nets(self):
+        return self.model().checked_names()
+
+    def checked_count(self):
+        return self.model().checked_count()
+
+
+def _populate_list(list_widget, texts):
+    """Replace the items of ``list_widget`` (a QListWidget or QComboBox) with ``texts`` in a single batch.
+
+    Repaints and signals are held back until every item is in, so a long
+    list costs one relayout instead of one per item.
+    """
+    list_widget.setUpdatesEnabled(False)
+    was_blocked = list_widget.blockSignals(True)
+    try:
+        list_widget.clear()
+        list_widget.addItems(list(texts))
+    finally:
+        list_widget.blockSignals(was_blocked)
+        list_widget.setUpdatesEnabled(True)
 
-        target_state = (
-            Qt.Checked
-            if selected_items[0].checkState() == Qt.Unchecked
-            else Qt.Unchecked
-        )
 
-        for item in selected_items:
-            item.setCheckState(target_state)
 class PortSetupTab(BaseTab):
     def __init__(self, context):
         super().__init__(context)
         self.all_components = []
+        # "name (pin_count)" list text for each entry of all_components,
+        # formatted once per load instead of on every filter pass.
+        self._component_labels = []
+        self._net_components_cache = None  # (pcb_data, {net: {component, ...}})
+        self._component_nets_cache = None  # (pcb_data, {component: Counter({net: pins})})
+        self._selection_nets_cache = None  # (pcb_data, {(controllers, drams): net lists})
         self.setup_ui()
+        # Compiled once per filter edit and reused for every component.
+        self._component_filter_re = re.compile(self.component_filter_input.text())
+        # Typing a pattern refilters once the user pauses, not per keystroke.
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(150)
+        self._filter_debounce.timeout.connect(self._apply_component_filter)
 
     def setup_ui(self):
         port_setup_layout = QVBoxLayout(self)
@@ -86,11 +202,11 @@ class PortSetupTab(BaseTab):
 
         nets_layout = QHBoxLayout()
         single_ended_group = QGroupBox("Single-Ended Nets")
-        self.single_ended_list = NetListWidget()
+        self.single_ended_list = NetListView()
         single_ended_layout = QVBoxLayout(single_ended_group)
         single_ended_layout.addWidget(self.single_ended_list)
         differential_pairs_group = QGroupBox("Differential Pairs")
-        self.differential_pairs_list = NetListWidget()
+        self.differential_pairs_list = NetListView()
         differential_pairs_layout = QVBoxLayout(differential_pairs_group)
         differential_pairs_layout.addWidget(self.differential_pairs_list)
         nets_layout.addWidget(single_ended_group)
@@ -99,46 +215,50 @@ class PortSetupTab(BaseTab):
 
         self.apply_button = QPushButton("Apply")
         self.apply_button.setEnabled(False)
-        primary_style = "background-color: #007bff; color: white; border: none;"
-        self.apply_button.setStyleSheet(primary_style)
-        self.apply_button_original_style = primary_style
+        self.apply_button.setObjectName("primaryButton")
+        self.apply_button_original_style = ""
         port_setup_layout.addWidget(self.apply_button, alignment=Qt.AlignRight)
 
     def bind_to_controller(self):
-        self.component_filter_input.textChanged.connect(self.filter_components)
+        self.component_filter_input.textChanged.connect(self._filter_debounce.start)
         self.controller_components_list.itemSelectionChanged.connect(self.update_nets)
         self.dram_components_list.itemSelectionChanged.connect(self.update_nets)
-        self.single_ended_list.itemChanged.connect(self.update_checked_count)
-        self.differential_pairs_list.itemChanged.connect(self.update_checked_count)
+        self.single_ended_list.model().dataChanged.connect(self.update_checked_count)
+        self.differential_pairs_list.model().dataChanged.connect(self.update_checked_count)
         self.apply_button.clicked.connect(self.apply_settings)
 
-    def filter_components(self):
+    def _apply_component_filter(self):
         pattern = self.component_filter_input.text()
+        if pattern == self._component_filter_re.pattern:
+            return  # e.g. a character typed and deleted again before the pause
         try:
-            regex = re.compile(pattern)
+            self._component_filter_re = re.compile(pattern)
         except re.error:
-            return
+            return  # keep the last valid filter while the user is typing
+        self.filter_components()
 
-        self.controller_components_list.clear()
-        self.dram_components_list.clear()
+    def filter_components(self):
+        search = self._component_filter_re.search
+        had_selection = bool(
+            self.controller_components_list.selectedItems()
+            or self.dram_components_list.selectedItems()
+        )
+
+        item_texts = [
+            label
+            for (comp_name, _), label in zip(self.all_components, self._component_labels)
+            if search(comp_name)
+        ]
+        _populate_list(self.controller_components_list, item_texts)
+        _populate_list(self.dram_components_list, item_texts)
 
-        for comp_name, pin_count in self.all_components:
-            if regex.search(comp_name):
-                item_text = f"{comp_name} ({pin_count})"
-                self.controller_components_list.addItem(item_text)
-                self.dram_components_list.addItem(item_text)
+        # Repopulating drops the selection without signalling it.
+        if had_selection:
+            self.update_nets()
 
     def update_checked_count(self):
-        checked_single = sum(
-            1
-            for i in range(self.single_ended_list.count())
-            if self.single_ended_list.item(i).checkState() == Qt.Checked
-        )
-        checked_diff = sum(
-            1
-            for i in range(self.differential_pairs_list.count())
-            if self.differential_pairs_list.item(i).checkState() == Qt.Checked
-        )
+        checked_single = self.single_ended_list.checked_count()
+        checked_diff = self.differential_pairs_list.checked_count()
         checked_nets = checked_single + (checked_diff * 2)
         ports = (checked_single * 2) + (checked_diff * 4)
         self.checked_nets_label.setText(
@@ -155,8 +275,7 @@ class PortSetupTab(BaseTab):
                 controller.log("Project file not found.", "red")
                 return
 
-            with open(controller.project_file, "r") as handle:
-                project_data = json.load(handle)
+            project_data = read_json(controller.project_file)
 
             controller.pcb_data = project_data.get("pcb_data")
             if not controller.pcb_data:
@@ -166,11 +285,21 @@ class PortSetupTab(BaseTab):
             self.controller_components_list.clear()
             self.dram_components_list.clear()
             if "component" in controller.pcb_data:
+                # Sort on (-pin_count, position, name) tuples so the comparison
+                # stays in C instead of calling a Python key function per
+                # element; the position keeps tied components in file order.
                 self.all_components = [
-                    (name, len(pins))
-                    for name, pins in controller.pcb_data["component"].items()
+                    (name, -neg_count)
+                    for neg_count, _, name in sorted(
+                        (-len(pins), index, name)
+                        for index, (name, pins) in enumerate(
+                            controller.pcb_data["component"].items()
+                        )
+                    )
+                ]
+                self._component_labels = [
+                    f"{name} ({pin_count})" for name, pin_count in self.all_components
                 ]
-                self.all_components.sort(key=lambda item: item[1], reverse=True)
                 self.filter_components()
         except Exception as exc:
             controller.log(f"Error loading data: {exc}", "red")
@@ -190,79 +319,104 @@ class PortSetupTab(BaseTab):
             for item in self.dram_components_list.selectedItems()
         ]
 
-        self.single_ended_list.blockSignals(True)
-        self.differential_pairs_list.blockSignals(True)
-
-        self.single_ended_list.clear()
-        self.differential_pairs_list.clear()
-        self.ref_net_combo.clear()
+        if not selected_controllers or not selected_drams:
+            self.single_ended_list.set_nets([])
+            self.differential_pairs_list.set_nets([])
+            _populate_list(self.ref_net_combo, ["GND"])
+            self.update_checked_count()
+            return
 
-        try:
-            if not selected_controllers or not selected_drams:
-                self.ref_net_combo.addItem("GND")
-                self.update_checked_count()
-                return
+        ref_nets, single_nets, diff_pairs = self._nets_for_selection(
+            pcb_data, tuple(selected_controllers), tuple(selected_drams)
+        )
+        # The most used net comes first and ends up selected.
+        _populate_list(self.ref_net_combo, ref_nets)
+        self.single_ended_list.set_nets(single_nets)
+        self.differential_pairs_list.set_nets(diff_pairs)
+
+        self.update_checked_count()
+
+    def _nets_for_selection(self, pcb_data, selected_controllers, selected_drams):
+        """Return ``(reference nets, single-ended nets, differential pairs)`` for a selection.
+
+        Results are remembered per pcb_data object, so going back to an
+        earlier selection does not recompute the net lists.
+        """
+        cached = self._selection_nets_cache
+        if cached is None or cached[0] is not pcb_data:
+            cached = self._selection_nets_cache = (pcb_data, {})
+        results = cached[1]
+        key = (selected_controllers, selected_drams)
+        result = results.get(key)
+        if result is not None:
+            return result
+
+        component_nets = self._component_net_counts(pcb_data)
+        no_nets = {}
+        controller_nets = set().union(
+            *(component_nets.get(comp, no_nets).keys() for comp in selected_controllers)
+        )
+        dram_nets = set().union(
+            *(component_nets.get(comp, no_nets).keys() for comp in selected_drams)
+        )
+        common_nets = controller_nets.intersection(dram_nets)
+
+        # Pins of the selected components on each common net. Adding the
+        # per-component counts in selection order keeps the nets in order of
+        # first appearance, so ties rank as they would counting pin by pin.
+        net_pin_counts = Counter()
+        for comp_name in selected_controllers + selected_drams:
+            for net, count in component_nets.get(comp_name, no_nets).items():
+                if net in common_nets:
+                    net_pin_counts[net] += count
+        ref_nets = [net_name for net_name, _ in net_pin_counts.most_common()]
+
+        diff_pairs_info = pcb_data.get("diff", {})
+        diff_pair_nets = {
+            net for pos_net, neg_net in diff_pairs_info.values() for net in (pos_net, neg_net)
+        }
 
-            controller_nets = {
-                pin[1]
-                for comp in selected_controllers
-                for pin in pcb_data["component"].get(comp, [])
-            }
-            dram_nets = {
-                pin[1]
-                for comp in selected_drams
-                for pin in pcb_data["component"].get(comp, [])
-            }
-            common_nets = controller_nets.intersection(dram_nets)
-
-            selected_components = selected_controllers + selected_drams
-            net_pin_counts = {
-                net: sum(
-                    1
-                    for comp_name in selected_components
-                    for pin in pcb_data["component"].get(comp_name, [])
-                    if pin[1] == net
-                )
+        single_nets = sorted(
+            [
+                net
                 for net in common_nets
-            }
-            sorted_nets = sorted(
-                net_pin_counts.items(), key=lambda item: item[1], reverse=True
-            )
-
-            for net_name, _ in sorted_nets:
-                self.ref_net_combo.addItem(net_name)
-            if sorted_nets:
-                self.ref_net_combo.setCurrentIndex(0)
-
-            diff_pairs_info = pcb_data.get("diff", {})
-            diff_pair_nets = {
-                net for pos_net, neg_net in diff_pairs_info.values() for net in (pos_net, neg_net)
-            }
-
-            single_nets = sorted(
-                [
-                    net
-                    for net in common_nets
-                    if net not in diff_pair_nets and net.upper() != "GND"
-                ]
-            )
-            for net in single_nets:
-                item = QListWidgetItem(net)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(Qt.Unchecked)
-                self.single_ended_list.addItem(item)
-
-            for pair_name, (pos_net, neg_net) in sorted(diff_pairs_info.items()):
-                if pos_net in common_nets and neg_net in common_nets:
-                    item = QListWidgetItem(pair_name)
-                    item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                    item.setCheckState(Qt.Unchecked)
-                    self.differential_pairs_list.addItem(item)
+                if net not in diff_pair_nets and net.upper() != "GND"
+            ]
+        )
+        diff_pairs = [
+            pair_name
+            for pair_name, (pos_net, neg_net) in sorted(diff_pairs_info.items())
+            if pos_net in common_nets and neg_net in common_nets
+        ]
 
-            self.update_checked_count()
-        finally:
-            self.single_ended_list.blockSignals(False)
-            self.differential_pairs_list.blockSignals(False)
+        if len(results) >= _SELECTION_CACHE_SIZE:
+            del results[next(iter(results))]  # drop the oldest selection
+        result = results[key] = (ref_nets, single_nets, diff_pairs)
+        return result
+
+    def _component_net_counts(self, pcb_data):
+        """Return ``{component: Counter({net: pin_count})}`` for ``pcb_data``, built once per pcb_data object."""
+        cached = self._component_nets_cache
+        if cached is not None and cached[0] is pcb_data:
+            return cached[1]
+        index = {
+            comp: Counter(pin[1] for pin in pins)
+            for comp, pins in pcb_data.get("component", {}).items()
+        }
+        self._component_nets_cache = (pcb_data, index)
+        return index
+
+    def _net_components(self, pcb_data):
+        """Return ``{net: {component, ...}}`` for ``pcb_data``, built once per pcb_data object."""
+        cached = self._net_components_cache
+        if cached is not None and cached[0] is pcb_data:
+            return cached[1]
+        index = {}
+        for comp, pins in pcb_data.get("component", {}).items():
+            for pin in pins:
+                index.setdefault(pin[1], set()).add(comp)
+        self._net_components_cache = (pcb_data, index)
+        return index
 
     def apply_settings(self):
         controller = self.controller
@@ -274,8 +428,7 @@ class PortSetupTab(BaseTab):
 
         project_data = {"app_name": controller.app_name}
         if controller.project_file and os.path.exists(controller.project_file):
-            with open(controller.project_file, "r") as handle:
-                project_data.update(json.load(handle))
+            project_data.update(read_json(controller.project_file))
 
         project_data.update(
             {
@@ -292,136 +445,47 @@ class PortSetupTab(BaseTab):
             }
         )
 
-        sequence = 1
         diff_pairs_info = controller.pcb_data.get("diff", {})
-
-        signal_nets = []
-        for idx in range(self.single_ended_list.count()):
-            item = self.single_ended_list.item(idx)
-            if item.checkState() == Qt.Checked:
-                net_name = item.text()
-                signal_nets.append(net_name)
-                for comp in project_data["controller_components"]:
-                    if any(
-                        pin[1] == net_name
-                        for pin in controller.pcb_data["component"].get(comp, [])
-                    ):
-                        project_data["ports"].append(
-                            {
-                                "sequence": sequence,
-                                "name": f"{sequence}_{comp}_{net_name}",
-                                "component": comp,
-                                "component_role": "controller",
-                                "net": net_name,
-                                "net_type": "single",
-                                "pair": None,
-                                "polarity": None,
-                                "reference_net": project_data["reference_net"],
-                            }
-                        )
-                        sequence += 1
-                for comp in project_data["dram_components"]:
-                    if any(
-                        pin[1] == net_name
-                        for pin in controller.pcb_data["component"].get(comp, [])
-                    ):
-                        project_data["ports"].append(
+        net_components = self._net_components(controller.pcb_data)
+        component_roles = (
+            ("controller", project_data["controller_components"]),
+            ("dram", project_data["dram_components"]),
+        )
+        ports = project_data["ports"]
+        reference_net = project_data["reference_net"]
+
+        def add_ports(net_name, net_type, pair=None, polarity=None):
+            # One port per selected component with a pin on the net,
+            # controllers first, numbered in creation order.
+            comps_on_net = net_components.get(net_name, ())
+            for role, comps in component_roles:
+                for comp in comps:
+                    if comp in comps_on_net:
+                        sequence = len(ports) + 1
+                        ports.append(
                             {
                                 "sequence": sequence,
                                 "name": f"{sequence}_{comp}_{net_name}",
                                 "component": comp,
-                                "component_role": "dram",
+                                "component_role": role,
                                 "net": net_name,
-                                "net_type": "single",
-                                "pair": None,
-                                "polarity": None,
-                                "reference_net": project_data["reference_net"],
-                            }
-                        )
-                        sequence += 1
-
-        for idx in range(self.differential_pairs_list.count()):
-            item = self.differential_pairs_list.item(idx)
-            if item.checkState() == Qt.Checked:
-                pair_name = item.text()
-                p_net, n_net = diff_pairs_info[pair_name]
-                signal_nets.extend([p_net, n_net])
-                for comp in project_data["controller_components"]:
-                    if any(
-                        pin[1] == p_net
-                        for pin in controller.pcb_data["component"].get(comp, [])
-                    ):
-                        project_data["ports"].append(
-                            {
-                                "sequence": sequence,
-                                "name": f"{sequence}_{comp}_{p_net}",
-                                "component": comp,
-                                "component_role": "controller",
-                                "net": p_net,
-                                "net_type": "differential",
-                                "pair": pair_name,
-                                "polarity": "positive",
-                                "reference_net": project_data["reference_net"],
-                            }
-                        )
-                        sequence += 1
-                for comp in project_data["dram_components"]:
-                    if any(
-                        pin[1] == p_net
-                        for pin in controller.pcb_data["component"].get(comp, [])
-                    ):
-                        project_data["ports"].append(
-                            {
-                                "sequence": sequence,
-                                "name": f"{sequence}_{comp}_{p_net}",
-                                "component": comp,
-                                "component_role": "dram",
-                                "net": p_net,
-                                "net_type": "differential",
-                                "pair": pair_name,
-                                "polarity": "positive",
-                                "reference_net": project_data["reference_net"],
+                                "net_type": net_type,
+                                "pair": pair,
+                                "polarity": polarity,
+                                "reference_net": reference_net,
                             }
                         )
-                        sequence += 1
-                for comp in project_data["controller_components"]:
-                    if any(
-                        pin[1] == n_net
-                        for pin in controller.pcb_data["component"].get(comp, [])
-                    ):
-                        project_data["ports"].append(
-                            {
-                                "sequence": sequence,
-                                "name": f"{sequence}_{comp}_{n_net}",
-                                "component": comp,
-                                "component_role": "controller",
-                                "net": n_net,
-                                "net_type": "differential",
-                                "pair": pair_name,
-                                "polarity": "negative",
-                                "reference_net": project_data["reference_net"],
-                            }
-                        )
-                        sequence += 1
-                for comp in project_data["dram_components"]:
-                    if any(
-                        pin[1] == n_net
-                        for pin in controller.pcb_data["component"].get(comp, [])
-                    ):
-                        project_data["ports"].append(
-                            {
-                                "sequence": sequence,
-                                "name": f"{sequence}_{comp}_{n_net}",
-                                "component": comp,
-                                "component_role": "dram",
-                                "net": n_net,
-                                "net_type": "differential",
-                                "pair": pair_name,
-                                "polarity": "negative",
-                                "reference_net": project_data["reference_net"],
-                            }
-                        )
-                        sequence += 1
+
+        signal_nets = []
+        for net_name in self.single_ended_list.checked_nets():
+            signal_nets.append(net_name)
+            add_ports(net_name, "single")
+
+        for pair_name in self.differential_pairs_list.checked_nets():
+            p_net, n_net = diff_pairs_info[pair_name]
+            signal_nets.extend([p_net, n_net])
+            add_ports(p_net, "differential", pair_name, "positive")
+            add_ports(n_net, "differential", pair_name, "negative")
 
         drams_with_ports = {
             port["component"]
@@ -448,44 +512,24 @@ class PortSetupTab(BaseTab):
 
         try:
             project_data["cct_ports_ready"] = bool(project_data["ports"])
-            with open(controller.project_file, "w") as handle:
-                json.dump(project_data, handle, indent=2)
+            write_json(controller.project_file, project_data)
             controller.log(
                 f"Successfully saved to {controller.project_file}. Now applying to EDB..."
             )
 
             controller.set_button_running(self.apply_button)
-            action_spec = controller.get_action_spec("set_edb", tab_name="port_setup_tab")
-            script_path = action_spec["script"]
-            python_executable = sys.executable
             edb_version = import_state.get("edb_version") or project_data.get(
                 "edb_version", ""
             )
-
-            command = [
-                python_executable,
-                script_path,
+            controller.run_script(
+                "set_edb",
                 controller.project_file,
                 edb_version,
-            ]
-            if action_spec.get("args"):
-                command.extend(action_spec["args"])
-
-            metadata = {
-                "type": "set_edb",
-                "description": "Applying port definitions to EDB",
-                "button": self.apply_button,
-                "button_style": getattr(self, "apply_button_original_style", ""),
-                "button_reset_text": "Apply",
-            }
-
-            controller.submit_task(
-                command,
-                metadata=metadata,
+                tab_name="port_setup_tab",
+                description="Applying port definitions to EDB",
+                button=self.apply_button,
+                button_style=getattr(self, "apply_button_original_style", ""),
                 input_path=controller.project_file,
-                description=metadata["description"],
-                working_dir=action_spec.get("working_dir"),
-                env=action_spec.get("env"),
             )
 
         except Exception as exc:
@@ -1,5 +1,4 @@
 import os
-import sys
 import webbrowser
 
 from PySide6.QtWidgets import (
@@ -36,9 +35,8 @@ class ResultTab(BaseTab):
         result_layout.addWidget(project_group)
         
         self.apply_result_button = QPushButton("Apply")
-        primary_style = "background-color: #007bff; color: white; border: none;"
-        self.apply_result_button.setStyleSheet(primary_style)
-        self.apply_result_button_original_style = primary_style
+        self.apply_result_button.setObjectName("primaryButton")
+        self.apply_result_button_original_style = ""
         result_layout.addWidget(self.apply_result_button, alignment=Qt.AlignRight)
         
         self.html_group = QGroupBox("HTML Report")
@@ -78,7 +76,7 @@ class ResultTab(BaseTab):
         controller.project_file = project_file
         self.html_group.setVisible(False)
         controller.set_button_running(self.apply_result_button)
-        self.run_get_loss()
+        self.run_loss_and_report()
 
     def open_report_in_browser(self):
         controller = self.controller
@@ -91,44 +89,15 @@ class ResultTab(BaseTab):
         else:
             controller.log("Report path not found or invalid.", "red")
 
-    def run_get_loss(self):
-        controller = self.controller
-        if not controller.project_file or not os.path.exists(controller.project_file):
-            controller.log("Project file not set. Cannot retrieve loss data.", "red")
-            controller.restore_button(
-                self.apply_result_button,
-                getattr(self, "apply_result_button_original_style", ""),
-                "Apply",
-            )
-            return
+    def run_loss_and_report(self):
+        """Collect loss data and build the HTML report as one chained task.
 
-        metadata = {
-            "type": "get_loss",
-            "description": "Collecting SIwave loss data",
-            "button": self.apply_result_button,
-            "button_style": getattr(self, "apply_result_button_original_style", ""),
-            "button_reset_text": "Apply",
-        }
-
-        action_spec = controller.get_action_spec("get_loss", tab_name="result_tab")
-        script_path = action_spec["script"]
-        command = [sys.executable, script_path, controller.project_file]
-        if action_spec.get("args"):
-            command.extend(action_spec["args"])
-
-        controller.submit_task(
-            command,
-            metadata=metadata,
-            input_path=controller.project_file,
-            description=metadata["description"],
-            working_dir=action_spec.get("working_dir"),
-            env=action_spec.get("env"),
-        )
-
-    def run_generate_report(self):
+        ``get_loss.py`` and ``generate_report.py`` run back to back; the report
+        only starts if the loss extraction succeeded.
+        """
         controller = self.controller
         if not controller.project_file or not os.path.exists(controller.project_file):
-            controller.log("Project file not set. Cannot generate report.", "red")
+            controller.log("Project file not set. Cannot retrieve loss data.", "red")
             controller.restore_button(
                 self.apply_result_button,
                 getattr(self, "apply_result_button_original_style", ""),
@@ -136,25 +105,13 @@ class ResultTab(BaseTab):
             )
             return
 
-        metadata = {
-            "type": "generate_report",
-            "description": "Generating HTML report",
-            "button": self.apply_result_button,
-            "button_style": getattr(self, "apply_result_button_original_style", ""),
-            "button_reset_text": "Apply",
-        }
-
-        action_spec = controller.get_action_spec("generate_report", tab_name="result_tab")
-        script_path = action_spec["script"]
-        command = [sys.executable, script_path, controller.project_file]
-        if action_spec.get("args"):
-            command.extend(action_spec["args"])
-
-        controller.submit_task(
-            command,
-            metadata=metadata,
+        controller.run_script_chain(
+            "post_processing",
+            ("get_loss", "generate_report"),
+            controller.project_file,
+            tab_name="result_tab",
+            description="Collecting SIwave loss data and generating HTML report",
+            button=self.apply_result_button,
+            button_style=getattr(self, "apply_result_button_original_style", ""),
             input_path=controller.project_file,
-            description=metadata["description"],
-            working_dir=action_spec.get("working_dir"),
-            env=action_spec.get("env"),
         )
@@ -1,8 +1,6 @@
-import json
 import os
-import sys
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QStringListModel, Qt
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -18,12 +16,18 @@ from PySide6.QtWidgets import (
     QHeaderView,
 )
 
+from src.services import read_json, write_json
+
 from .base import BaseTab
 
 
 class SimulationTab(BaseTab):
+    _SWEEP_TYPES = ("linear count", "log scale", "linear scale")
+
     def __init__(self, context):
         super().__init__(context)
+        # One item model shared by the sweep-type combo box of every row.
+        self._sweep_type_model = QStringListModel(list(self._SWEEP_TYPES), self)
         self.setup_ui()
         self.controller.subscribe("ports.updated", self.on_ports_updated)
         self._sync_from_state()
@@ -64,10 +68,15 @@ class SimulationTab(BaseTab):
         self.sweeps_table.setHorizontalHeaderLabels(
             ["Sweep Type", "Start", "Stop", "Step/Count"]
         )
+        self.set_sweeps(
+            [
+                ["linear count", "0", "1kHz", "3"],
+                ["log scale", "1kHz", "0.1GHz", "10"],
+                ["linear scale", "0.1GHz", "10GHz", "0.1GHz"],
+            ]
+        )
+        # Stretch only once the default rows are in.
         self.sweeps_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.add_sweep(["linear count", "0", "1kHz", "3"])
-        self.add_sweep(["log scale", "1kHz", "0.1GHz", "10"])
-        self.add_sweep(["linear scale", "0.1GHz", "10GHz", "0.1GHz"])
         sweeps_layout.addWidget(self.sweeps_table)
 
         sweep_buttons_layout = QHBoxLayout()
@@ -82,9 +91,8 @@ class SimulationTab(BaseTab):
         simulation_layout.addWidget(sweeps_group)
 
         self.apply_simulation_button = QPushButton("Apply")
-        primary_style = "background-color: #007bff; color: white; border: none;"
-        self.apply_simulation_button.setStyleSheet(primary_style)
-        self.apply_simulation_button_original_style = primary_style
+        self.apply_simulation_button.setObjectName("primaryButton")
+        self.apply_simulation_button_original_style = ""
         simulation_layout.addWidget(self.apply_simulation_button, alignment=Qt.AlignRight)
         simulation_layout.addStretch()
 
@@ -98,28 +106,60 @@ class SimulationTab(BaseTab):
             sweep_data = ["linear count", "", "", ""]
         row_position = self.sweeps_table.rowCount()
         self.sweeps_table.insertRow(row_position)
+        self._fill_sweep_row(row_position, sweep_data)
 
+    def set_sweeps(self, sweeps):
+        """Replace all sweep rows at once (one resize, one repaint)."""
+        table = self.sweeps_table
+        table.setUpdatesEnabled(False)
+        was_blocked = table.blockSignals(True)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(sweeps))
+            for row, sweep_data in enumerate(sweeps):
+                self._fill_sweep_row(row, sweep_data)
+        finally:
+            table.blockSignals(was_blocked)
+            table.setUpdatesEnabled(True)
+
+    def _fill_sweep_row(self, row, sweep_data):
         sweep_type_combo = QComboBox()
-        sweep_type_combo.addItems(["linear count", "log scale", "linear scale"])
+        sweep_type_combo.setModel(self._sweep_type_model)
         sweep_type_combo.setCurrentText(sweep_data[0])
 
-        self.sweeps_table.setCellWidget(row_position, 0, sweep_type_combo)
-        self.sweeps_table.setItem(row_position, 1, QTableWidgetItem(str(sweep_data[1])))
-        self.sweeps_table.setItem(row_position, 2, QTableWidgetItem(str(sweep_data[2])))
-        self.sweeps_table.setItem(row_position, 3, QTableWidgetItem(str(sweep_data[3])))
+        self.sweeps_table.setCellWidget(row, 0, sweep_type_combo)
+        for column in (1, 2, 3):
+            self.sweeps_table.setItem(row, column, QTableWidgetItem(str(sweep_data[column])))
 
     def remove_selected_sweep(self):
-        selected_ranges = self.sweeps_table.selectedRanges()
-        if not selected_ranges:
+        rows = sorted(
+            {
+                row
+                for s_range in self.sweeps_table.selectedRanges()
+                for row in range(s_range.topRow(), s_range.bottomRow() + 1)
+            },
+            reverse=True,
+        )
+        if not rows:
             return
 
-        rows_to_remove = set()
-        for s_range in selected_ranges:
-            for row in range(s_range.topRow(), s_range.bottomRow() + 1):
-                rows_to_remove.add(row)
-
-        for row in sorted(list(rows_to_remove), reverse=True):
-            self.sweeps_table.removeRow(row)
+        # Remove each contiguous block of rows with one removeRows() call,
+        # bottom block first so the remaining row numbers stay valid.
+        runs = []  # [first_row, count]
+        for row in rows:
+            if runs and row == runs[-1][0] - 1:
+                runs[-1][0] = row
+                runs[-1][1] += 1
+            else:
+                runs.append([row, 1])
+
+        model = self.sweeps_table.model()
+        self.sweeps_table.setUpdatesEnabled(False)
+        try:
+            for first_row, count in runs:
+                model.removeRows(first_row, count)
+        finally:
+            self.sweeps_table.setUpdatesEnabled(True)
 
     def bind_to_controller(self):
         self.apply_simulation_button.clicked.connect(self.apply_simulation_settings)
@@ -138,8 +178,7 @@ class SimulationTab(BaseTab):
 
         project_data = {"app_name": controller.app_name}
         if controller.project_file and os.path.exists(controller.project_file):
-            with open(controller.project_file, "r") as handle:
-                project_data.update(json.load(handle))
+            project_data.update(read_json(controller.project_file))
 
         sweeps = []
         for row in range(self.sweeps_table.rowCount()):
@@ -168,38 +207,21 @@ class SimulationTab(BaseTab):
         )
 
         try:
-            with open(controller.project_file, "w") as handle:
-                json.dump(project_data, handle, indent=2)
+            write_json(controller.project_file, project_data)
             controller.log(
                 f"Simulation settings saved to {controller.project_file}"
             )
 
             controller.log("Applying simulation settings to EDB...")
             controller.set_button_running(self.apply_simulation_button)
-            action_spec = controller.get_action_spec("set_sim", tab_name="simulation_tab")
-            script_path = action_spec["script"]
-            python_executable = sys.executable
-            command = [python_executable, script_path, controller.project_file]
-            if action_spec.get("args"):
-                command.extend(action_spec["args"])
-
-            metadata = {
-                "type": "set_sim",
-                "description": "Applying simulation setup",
-                "button": self.apply_simulation_button,
-                "button_style": getattr(
-                    self, "apply_simulation_button_original_style", ""
-                ),
-                "button_reset_text": "Apply",
-            }
-
-            controller.submit_task(
-                command,
-                metadata=metadata,
+            controller.run_script(
+                "set_sim",
+                controller.project_file,
+                tab_name="simulation_tab",
+                description="Applying simulation setup",
+                button=self.apply_simulation_button,
+                button_style=getattr(self, "apply_simulation_button_original_style", ""),
                 input_path=controller.project_file,
-                description=metadata["description"],
-                working_dir=action_spec.get("working_dir"),
-                env=action_spec.get("env"),
             )
 
         except Exception as exc:
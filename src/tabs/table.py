@@ -18,6 +18,8 @@ from PySide6.QtWidgets import (
     QHeaderView,
 )
 
+from src.services import read_json
+
 from .base import BaseTab
 
 
@@ -86,8 +88,7 @@ class Table(BaseTab):
             return
 
         try:
-            with open(project_path, "r", encoding="utf-8") as handle:
-                project_data = json.load(handle)
+            project_data = read_json(project_path)
         except (OSError, json.JSONDecodeError) as exc:
             self._log(f"Could not load project file: {exc}", "red")
             return